@@ -38,6 +38,8 @@ from qos_maliyet import (
 from Q_Learning_Gokberk_Gok_ import (
     QLearning, 
     train_q_learning,
+    train_q_learning_batched,
+    NUM_AGENTS,
     path_total_delay,
     path_reliability_cost,
     path_resource_cost,
@@ -83,6 +85,7 @@ spec_aco = importlib.util.spec_from_file_location("aco_module", aco_path)
 aco_module = importlib.util.module_from_spec(spec_aco)
 spec_aco.loader.exec_module(aco_module)
 ACOSolver = aco_module.ACOSolver
+PheromoneStore = aco_module.PheromoneStore
 
 # Genetik Algoritma modülünden gerekli fonksiyonları import et
 genetic_path = os.path.join(os.path.dirname(__file__), "Genetik_Algoritmasi_Azra_Kaya.py")
@@ -95,7 +98,8 @@ genetic_algorithm = genetic_module.genetic_algorithm
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QComboBox, QPushButton, QFrame, QGroupBox, QGridLayout, QDoubleSpinBox,
-    QMessageBox, QTabWidget, QTableWidget, QTableWidgetItem, QSpinBox, QHeaderView, QFileDialog, QDialog, QTextEdit
+    QMessageBox, QTabWidget, QTableWidget, QTableWidgetItem, QSpinBox, QHeaderView, QFileDialog, QDialog, QTextEdit,
+    QCheckBox
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
@@ -280,14 +284,18 @@ QTableCornerButton::section {
 #                Q-LEARNING PARAMETRE DIALOG
 # ================================================================
 class QLearningParamsDialog(QDialog):
-    """Q-Learning hiperparametrelerini ayarlamak için dialog penceresi"""
+    """
+    Q-Learning hiperparametrelerini ayarlamak için dialog penceresi.
+    bulk=True ise (toplu test) toplu (batched) eğitim seçeneği de gösterilir.
+    """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, bulk=False):
         super().__init__(parent)
         self.setWindowTitle("Q-Learning Parametreleri")
         self.setModal(True)
         self.setStyleSheet(NEON_STYLE)
-        self.setFixedSize(400, 350)
+        self.bulk = bulk
+        self.setFixedSize(400, 390 if bulk else 350)
         
         # Varsayılan değerler
         self.alpha = 0.1
@@ -355,7 +363,8 @@ class QLearningParamsDialog(QDialog):
         lbl_episodes.setStyleSheet("color: #2a2a2a; font-weight: bold;")
         params_layout.addWidget(lbl_episodes, 3, 0)
         self.spin_episodes = QSpinBox()
-        self.spin_episodes.setRange(10, 1000)
+        # Toplu (batched) eğitim büyük episode bütçelerini karşılanabilir kılar
+        self.spin_episodes.setRange(10, 20000 if self.bulk else 1000)
         self.spin_episodes.setSingleStep(10)
         self.spin_episodes.setValue(self.episodes)
         params_layout.addWidget(self.spin_episodes, 3, 1)
@@ -369,6 +378,12 @@ class QLearningParamsDialog(QDialog):
         self.spin_max_steps.setSingleStep(10)
         self.spin_max_steps.setValue(self.max_steps)
         params_layout.addWidget(self.spin_max_steps, 4, 1)
+
+        # Toplu (batched) eğitim: NUM_AGENTS ajan aynı anda NumPy dizileriyle ilerletilir
+        if self.bulk:
+            self.chk_batched = QCheckBox(f"Toplu Eğitim ({NUM_AGENTS} ajan, NumPy)")
+            self.chk_batched.setStyleSheet("color: #2a2a2a; font-weight: bold;")
+            params_layout.addWidget(self.chk_batched, 5, 0, 1, 2)
         
         params_group.setLayout(params_layout)
         layout.addWidget(params_group)
@@ -404,6 +419,8 @@ class QLearningParamsDialog(QDialog):
         self.spin_epsilon.setValue(0.2)
         self.spin_episodes.setValue(300)
         self.spin_max_steps.setValue(250)
+        if self.bulk:
+            self.chk_batched.setChecked(False)
     
     def get_params(self):
         """Parametreleri döndür"""
@@ -412,7 +429,8 @@ class QLearningParamsDialog(QDialog):
             'gamma': self.spin_gamma.value(),
             'epsilon': self.spin_epsilon.value(),
             'episodes': self.spin_episodes.value(),
-            'max_steps': self.spin_max_steps.value()
+            'max_steps': self.spin_max_steps.value(),
+            'batched': self.bulk and self.chk_batched.isChecked()
         }
 
 # ================================================================
@@ -1381,7 +1399,7 @@ class CyberPunkApp(QMainWindow):
                 params = dialog.get_params()
                 result = QDialog.DialogCode.Accepted
         elif "Q-Learning" in algo_name:
-            dialog = QLearningParamsDialog(self)
+            dialog = QLearningParamsDialog(self, bulk=True)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 params = dialog.get_params()
                 result = QDialog.DialogCode.Accepted
@@ -1517,6 +1535,13 @@ class CyberPunkApp(QMainWindow):
         # ----------------------------------------------------------------
         total_tests = len(scenarios)
         self.log(f"🧪 Toplu Test Başlıyor: {algo_name}, {total_tests} senaryo")
+
+        # ACO senaryoları feromonları paylaşır: Sonraki talepler öncekilerin izinden başlar.
+        # Listede tekrar eden bir talep, ilk çalıştırılmasından önceki izden başlar (kendi izinden değil).
+        pheromone_store = PheromoneStore(aco_module.ACO_PHEROMONE_DIR) if "ACO" in algo_name else None
+        demand_snapshots = {}
+        # algo_graph döngü boyunca değişmez: Depo anahtarının sürümü bir kez hesaplanır
+        graph_version = aco_module.topology_version(algo_graph) if pheromone_store is not None else None
         
         for i, (s, d, bw_req) in enumerate(scenarios):
             # Pause Check
@@ -1555,7 +1580,9 @@ class CyberPunkApp(QMainWindow):
                     path, cost_val = sarsa_route(self.G, s, d, bw_req, episodes_, seed=42)
                 
                 elif "Q-Learning" in algo_name:
-                    path, cost_val = train_q_learning(
+                    # Toplu eğitim seçildiyse episode'lar NUM_AGENTS ajanla lockstep yürütülür
+                    trainer = train_q_learning_batched if params.get('batched') else train_q_learning
+                    path, cost_val = trainer(
                         self.G, s, d,
                         params.get('alpha', 0.1), params.get('gamma', 0.99), params.get('epsilon', 0.1),
                         params.get('episodes', 200), params.get('max_steps', 200),
@@ -1586,11 +1613,18 @@ class CyberPunkApp(QMainWindow):
                     path, cost_val = pso_solver.run()
                 
                 elif "ACO" in algo_name:
+                    demand = (s, d, bw_req)
+                    if demand in demand_snapshots:
+                        store = demand_snapshots[demand]
+                    else:
+                        demand_snapshots[demand] = pheromone_store.snapshot(algo_graph, weights_tuple, bw_req,
+                                                                            version=graph_version)
+                        store = pheromone_store
                     path, cost_val, _ = ACOSolver.solve(
                         algo_graph, s, d, weights_tuple, bw_req,
                         num_ants=params.get('num_ants', 20), 
                         num_iterations=params.get('num_iterations', 30),
-                        seed=42
+                        seed=42, pheromone_store=store, graph_version=graph_version
                     )
                 
             except Exception as e:
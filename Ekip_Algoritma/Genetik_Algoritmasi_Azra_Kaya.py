@@ -8,13 +8,18 @@
 # 1. Başlangıçta rastgele yollar üretilir (Popülasyon).
 # 2. Her yolun kalitesi (Fitness) hesaplanır (Gecikme, Güvenilirlik, Bant Genişliği).
 # 3. En iyi yollar seçilir (Selection).
-# 4. Seçilen yollar üzerinde değişiklikler yapılır (Mutation/Crossover - Bu kodda basitleştirilmiş mutasyon var).
+# 4. Seçilen yollar çaprazlanır (ortak düğümden Crossover) ve mutasyona uğratılır
+#    (bir noktadan sonrası bant genişliğine uygun kenarlarla yeniden üretilir).
 # 5. Bu işlem belirli bir nesil (generation) sayısı kadar tekrarlanır.
 # =================================================================================================
 
 import pandas as pd
 import networkx as nx
 import os, math, random
+from fitness_onbellegi import FitnessCache
+from kisitli_yol import ConstrainedWalker
+from kararli_populasyon import SteadyStatePopulation
+from ada_modeli import run_islands, ISLANDS, MIGRATION_INTERVAL, MIGRANTS
 
 # =================================================================================================
 # DOSYA YOLLARI VE YAPILANDIRMA
@@ -147,7 +152,9 @@ def weighted_cost(G, path, w1, w2, w3):
 # GENETİK ALGORİTMA (CORE)
 # =================================================================================================
 def genetic_algorithm(G, source, target, bw, w1, w2, w3,
-                      pop_size=60, generations=120, mutation_rate=0.2, seed=None):
+                      pop_size=60, generations=120, mutation_rate=0.2, seed=None, rng=None,
+                      fitness_cache=None, initial_population=None, population_out=None,
+                      steady_state=False, best_history=None):
     """
     Genetik Algoritma ile en iyi yolu arar.
     
@@ -158,73 +165,123 @@ def genetic_algorithm(G, source, target, bw, w1, w2, w3,
     - w1, w2, w3: Gecikme, Güvenilirlik ve Kaynak Ağırlıkları
     - pop_size: Popülasyon büyüklüğü (aynı anda kaç yol denenecek)
     - generations: Kaç nesil boyunca evrimleşecek
+    - mutation_rate: Bir çocuğun mutasyona uğrama olasılığı
     - seed: Tekrarlanabilirlik için seed
+    - rng: (Opsiyonel) random.Random örneği. Verilmezse seed ile çağrıya özel oluşturulur;
+           global 'random' durumu kullanılmadığı için eşzamanlı çağrılar birbirini etkilemez.
+    - fitness_cache: (Opsiyonel) fitness_onbellegi.FitnessCache. Aynı talebin tekrarlarında
+           paylaşılırsa önceki çalıştırmaların skorları da yeniden kullanılır.
+    - initial_population: (Opsiyonel) Başlangıç popülasyonuna önce eklenecek yollar
+           (ada modelinde önceki dönemin popülasyonu ve göçmenler). Eksik kalan yerler
+           rastgele yollarla doldurulur.
+    - population_out: (Opsiyonel) list. Verilirse son popülasyon maliyete göre sıralı
+           (yol, maliyet) çiftleri olarak eklenir.
+    - steady_state: True ise kararlı durum (steady-state) modu: Nesil başına tüm popülasyonu
+           yeniden kurmak yerine her adımda tek çocuk üretilir; çocuk sadece yeniyse ve en kötü
+           bireyden iyiyse onun yerine geçer (generations * pop_size adım).
+    - best_history: (Opsiyonel) list. En iyi maliyet her iyileştiğinde (adım, maliyet) eklenir
+           (adım: nesilsel modda nesil, kararlı durum modunda üretilen çocuk sayısı).
     """
-    if seed is not None:
-        random.seed(seed)
-
+    if rng is None:
+        rng = random.Random(seed)
 
     # Ağırlıkları normalize et (Toplamı 1 olsun)
     s = w1 + w2 + w3
     w1, w2, w3 = w1/s, w2/s, w3/s
 
-    # --- Yardımcı Fonksiyon: Rastgele Yol Üretme ---
-    def random_path(max_steps=60):
-        """Rastgele yürüyüş (random walk) ile kaynaktan hedefe bir yol bulmaya çalışır."""
-        path = [source]
-        current = source
-
-        for _ in range(max_steps):
-            # Gittiğimiz yere geri dönmemek için (döngü engelleme) visited kontrolü yapıyoruz
-            nbrs = [n for n in G.neighbors(current) if n not in path]
-            
-            if not nbrs:
-                return None # Çıkmaz sokak
-            
-            if target in nbrs:
-                return path + [target] # Hedefe ulaştık!
-            
-            current = random.choice(nbrs)
-            path.append(current)
-
-        return None # Hedefe ulaşamadan adım sayısı bitti
+    # --- Fitness Önbelleği ---
+    # Elitler ve yakınsamış popülasyondaki kopya yollar her nesilde yeniden skorlanmaz.
+    if fitness_cache is None:
+        fitness_cache = FitnessCache()
+    fitness_cache.bind((bw, w1, w2, w3))
+
+    def path_cost(p):
+        """Bant genişliğini sağlamayan yol için sonsuz, aksi halde ağırlıklı maliyet."""
+        if not check_bandwidth(G, p, bw):
+            return float("inf")
+        return weighted_cost(G, p, w1, w2, w3)
+
+    def fitness(p):
+        return fitness_cache.get(p, path_cost)
+
+    # --- Kısıtlı Yol Üreticisi ---
+    # Sadece bw'yi sağlayan ve hedefe hâlâ ulaşabilen düğümler üzerinde yürür;
+    # her çekiliş döngüsüz ve geçerli bir yol verir (çıkmaz sokak/ret yok).
+    walker = ConstrainedWalker(G, target, bw)
+
+    # --- Genetik Operatörler ---
+    def tournament(scored, k=3):
+        """Turnuva seçimi: Rastgele k birey arasından maliyeti en düşük olan seçilir."""
+        return min(rng.sample(scored, min(k, len(scored))), key=lambda x: x[1])[0]
+
+    def crossover(p1, p2):
+        """
+        Ortak düğümden çaprazlama: p1'in başı ile p2'nin sonu ortak bir ara düğümde birleştirilir.
+        Ortak düğüm yoksa veya çocukta döngü oluşursa p1 döndürülür.
+        """
+        common = list(set(p1[1:-1]) & set(p2[1:-1]))
+        if not common:
+            return p1
+        cut = rng.choice(common)
+        child = p1[:p1.index(cut)] + p2[p2.index(cut):]
+        if len(child) != len(set(child)):
+            return p1
+        return child
+
+    def mutate(path):
+        """Segment yenileme mutasyonu: Rastgele bir noktadan sonrası yeniden üretilir."""
+        if len(path) < 3:
+            return path
+        idx = rng.randint(1, len(path) - 2)
+        new_path = walker.walk(path[:idx + 1], rng)
+        return new_path if new_path else path
 
     # 1. ADIM: BAŞLANGIÇ POPÜLASYONU (INITIALIZATION)
-    # Rastgele yollar üreterek havuzu dolduruyoruz.
-    population = []
-    max_attempts = pop_size * 20  # Sonsuz döngüye girmemek için limit
-    attempts = 0
-    
-    print(f"🔍 Popülasyon oluşturuluyor (hedef: {pop_size} birey)...")
-    
-    while len(population) < pop_size and attempts < max_attempts:
-        attempts += 1
-        p = random_path()
-        # Yol bulunduysa VE bant genişliğini sağlıyorsa havuza ekle
-        if p and check_bandwidth(G, p, bw):
-            population.append(p)
-            if len(population) % 10 == 0:
-                print(f"  ✓ {len(population)} birey oluşturuldu...")
-    
-    print(f"📊 Popülasyon tamamlandı: {len(population)}/{pop_size} birey ({attempts} deneme)")
-    
-    # Yeterli çeşitlilik (birey) yoksa algoritma çalışamaz
-    min_required = max(3, pop_size // 20)  
-    if len(population) < min_required:
-        print(f"❌ Yetersiz popülasyon! En az {min_required} birey gerekli, sadece {len(population)} oluşturuldu")
+    # Kaynak, bant genişliğine uygun kenarlarla hedefe ulaşamıyorsa hiçbir birey üretilemez.
+    if not walker.can_reach(source):
+        print(f"❌ Kaynaktan hedefe {bw} Mbps'i sağlayan bir yol yok")
         print(f"💡 İpucu: Bandwidth kısıtı çok yüksek olabilir (şu an: {bw} Mbps)")
         return None, float("inf")
 
+    # Rastgele yollar üreterek havuzu dolduruyoruz (her yürüyüş geçerli bir birey verir).
+    print(f"🔍 Popülasyon oluşturuluyor (hedef: {pop_size} birey)...")
+    population = [list(p) for p in (initial_population or [])][:pop_size]
+    population += [walker.walk([source], rng) for _ in range(pop_size - len(population))]
+    print(f"📊 Popülasyon tamamlandı: {len(population)}/{pop_size} birey")
+
+    # 2. ADIM (KARARLI DURUM MODU): Tek çocuk ekle, en kötüyü at
+    if steady_state:
+        pool = SteadyStatePopulation(pop_size)
+        for p in population:
+            pool.offer(p, fitness(p))
+        if best_history is not None and pool.best_path is not None:
+            best_history.append((0, pool.best_cost))
+
+        for step in range(1, generations * pop_size + 1):
+            child = crossover(pool.tournament(rng), pool.tournament(rng))
+            if rng.random() < mutation_rate:
+                child = mutate(child)
+            if child in pool:
+                child = mutate(child)
+            previous = pool.best_cost
+            pool.offer(child, fitness(child))
+            if best_history is not None and pool.best_cost < previous:
+                best_history.append((step, pool.best_cost))
+
+        if population_out is not None:
+            population_out.extend(pool.items())
+        return pool.best_path, pool.best_cost
+
     best_path = None
     best_cost = float("inf")
 
     # 2. ADIM: EVRİM DÖNGÜSÜ (EVOLUTION LOOP)
     for gen in range(generations):
-        # Her bireyin skorunu hesapla
+        # Her bireyin skorunu hesapla (önbellekten; sadece yeni yollar hesaplanır)
         scored = []
         for p in population:
-            if check_bandwidth(G, p, bw):
-                cost = weighted_cost(G, p, w1, w2, w3)
+            cost = fitness(p)
+            if cost != float("inf"):
                 scored.append((p, cost))
 
         if not scored:
@@ -237,19 +294,76 @@ def genetic_algorithm(G, source, target, bw, w1, w2, w3,
         if scored[0][1] < best_cost:
             best_cost = scored[0][1]
             best_path = scored[0][0]
+            if best_history is not None:
+                best_history.append((gen, best_cost))
 
         # ELITIZM: En iyi bireyleri doğrudan sonraki nesile aktar
         # Popülasyonun %10'u "Elite" olarak saklanır.
         elite = [p for p, _ in scored[:max(1, pop_size // 10)]]
         population = elite[:] # Yeni popülasyonu elitlerle başlat
-
-        # Popülasyon dolana kadar elitlerden türet (Basit Kopyalama/Mutasyon)
-        # Not: Tam bir crossover yerine burada elitlerden rastgele seçim (selection) kullanılıyor.
+        seen = {tuple(p) for p in population}
+
+        # Popülasyon dolana kadar Seçim -> Çaprazlama -> Mutasyon ile yeni bireyler üret.
+        # Aynı yol ikinci kez eklenmez (kopya bireyler çeşitliliği öldürür ve boşuna skorlanır);
+        # kopya çıkan çocuk bir kez daha mutasyona uğratılır.
+        tries = 0
+        while len(population) < pop_size and tries < pop_size * 10:
+            tries += 1
+            child = crossover(tournament(scored), tournament(scored))
+            if rng.random() < mutation_rate:
+                child = mutate(child)
+            if tuple(child) in seen:
+                child = mutate(child)
+            key = tuple(child)
+            if key in seen or fitness(child) == float("inf"):
+                continue
+            seen.add(key)
+            population.append(child)
+
+        # Graf çok küçükse farklı yol kalmamış olabilir: kalan yerler elitlerle doldurulur
         while len(population) < pop_size:
-            population.append(random.choice(elite))
+            population.append(rng.choice(elite))
+
+    if population_out is not None:
+        final = [(p, fitness(p)) for p in population]
+        population_out.extend(sorted((pc for pc in final if pc[1] != float("inf")), key=lambda x: x[1]))
 
     return best_path, best_cost
 
+# =================================================================================================
+# ADA MODELİ (PARALEL GA)
+# =================================================================================================
+def _island_epoch(G, params, generations, rng, population, fitness_cache):
+    """Bir adanın 'generations' nesillik dönemi (ada_modeli işçilerinde çalışır)."""
+    final = []
+    path, cost = genetic_algorithm(
+        G, generations=generations, rng=rng, fitness_cache=fitness_cache,
+        initial_population=[p for p, _ in population] if population else None,
+        population_out=final, **params
+    )
+    # Son nesil henüz en iyi kontrolünden geçmedi; sıralı son popülasyonun başına bakılır
+    if final and final[0][1] < cost:
+        path, cost = final[0]
+    return path, cost, final
+
+
+def island_genetic_algorithm(G, source, target, bw, w1, w2, w3,
+                             pop_size=60, generations=120, mutation_rate=0.2,
+                             islands=ISLANDS, migration_interval=MIGRATION_INTERVAL,
+                             migrants=MIGRANTS, seed=None):
+    """
+    genetic_algorithm'in ada modeli (island model) paralel sürümü.
+
+    'islands' ada ayrı süreçlerde 'pop_size' bireyle evrimleşir; her 'migration_interval'
+    nesilde bir, her adanın en iyi 'migrants' bireyi halka düzeninde komşu adaya göç eder.
+    Sabit (seed, islands) için sonuç tekrarlanabilir.
+    """
+    params = {"source": source, "target": target, "bw": bw, "w1": w1, "w2": w2, "w3": w3,
+              "pop_size": pop_size, "mutation_rate": mutation_rate}
+    return run_islands(G, (os.path.abspath(__file__), "_island_epoch"), params, generations,
+                       islands=islands, migration_interval=migration_interval,
+                       migrants=migrants, seed=seed)
+
 # =================================================================================================
 # MODÜL TEST KODU (Bu dosya doğrudan çalıştırılırsa burası devreye girer)
 # =================================================================================================
@@ -294,10 +408,12 @@ if __name__ == "__main__":
         best_path = None
         best_cost = float("inf")
 
+        # Aynı talebin 20 tekrarı tek bir fitness önbelleğini paylaşır
+        cache = FitnessCache()
         for _ in range(20):
             p, c = genetic_algorithm(
                 G, d["source"], d["target"], d["bandwidth"],
-                w1, w2, w3
+                w1, w2, w3, fitness_cache=cache
             )
             if p and c < best_cost:
                 best_cost = c
@@ -18,6 +18,16 @@ import csv
 import os
 from collections import defaultdict
 
+from fitness_onbellegi import FitnessCache
+from kisitli_yol import ConstrainedWalker
+from kararli_populasyon import SteadyStatePopulation
+from feromon_deposu import PheromoneStore
+from ornekleme import CumulativeSampler
+from q_tablosu import topology_version
+from ada_modeli import (run_islands, ISLANDS, MIGRATION_INTERVAL, MIGRANTS,
+                        share_graph, attach_graph, share_array, attach_array,
+                        file_worker_pool, run_file_task)
+
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
@@ -37,6 +47,35 @@ NODE_FILE = os.path.join(BASE_DIR, "BSM307_317_Guz2025_TermProject_NodeData.csv"
 EDGE_FILE = os.path.join(BASE_DIR, "BSM307_317_Guz2025_TermProject_EdgeData.csv")
 DEMAND_FILE = os.path.join(BASE_DIR, "BSM307_317_Guz2025_TermProject_DemandData.csv")
 
+# GA erken durdurma ölçütleri (GASolver.solve). Varsayılan kapalıdır (None): Tüm nesiller
+# çalışır ve mevcut çağrıların sonuçları değişmez. Hız isteyen çağrılar (arayüz) açıkça verir.
+GA_STAGNATION_LIMIT = None   # Global en iyi bu kadar nesil iyileşmezse dur
+GA_MIN_DIVERSITY = None      # Popülasyondaki farklı yol sayısı bunun altına düşerse dur
+# Arayüzün (tek çalıştırma ve toplu test) kullandığı erken durdurma değerleri
+GA_GUI_STAGNATION_LIMIT = 8
+GA_GUI_MIN_DIVERSITY = 2
+
+# ACO tembel buharlaşma eşiği (ACOSolver.solve, lazy_evaporation=None iken):
+# Geçerli kenar pozisyonu sayısı bunu aşarsa feromonlar sadece okunduklarında buharlaştırılır.
+ACO_LAZY_EVAPORATION_MIN_EDGES = 2_000_000
+# ACO paralel karınca yürüyüşleri (ACOSolver.solve): 1 = tek süreç; K > 1 = her iterasyonun
+# karıncaları K süreçte yürür. Küçük graflarda süreç maliyeti kazançtan büyüktür.
+ACO_WORKERS = 1
+
+# ACO geri izlemeli karıncalar (ACOSolver.solve, backtrack=None iken): Çıkmaz sokağa giren karınca
+# yürüyüşü atmak yerine denenmemiş komşusu kalan son düğüme geri döner.
+ACO_BACKTRACK = False
+ACO_MAX_BACKTRACKS = 10  # Karınca başına geri izleme hakkı (None = sınırsız; her düğüm en fazla bir kez bırakılır)
+
+# ACO aday listesi (ACOSolver.solve, candidates=None iken): Karınca önce sezgisel olarak en iyi
+# k komşuya bakar, hepsi ziyaret edilmişse tüm satıra döner. None = kapalı (tüm komşular).
+ACO_CANDIDATES = None
+# ACO dinamik tau_max (ACOSolver.solve): True ise sabit 10.0 yerine en iyi maliyetten hesaplanır.
+ACO_DYNAMIC_TAU_MAX = False
+
+# Toplu testlerde talepler arası feromon deposunun kaydedileceği dizin (None = sadece bellekte)
+ACO_PHEROMONE_DIR = None
+
 def create_graph_from_csv():
     G = nx.Graph()
     
@@ -137,15 +176,183 @@ def calculate_total_cost(G, path, weights):
 # 2. ACO ÇÖZÜCÜ (KARINCA KOLONİSİ ALGORİTMASI)
 # =================================================================================================
 
+def build_aco_arrays(graph, weights, min_bw, beta, sort_by_eta=False):
+    """
+    ACO için bant genişliği şartını sağlayan kenarları CSR (Compressed Sparse Row) dizilerine çıkarır.
+
+    - indptr[i] : i. düğümün kenarlarının başlangıç pozisyonu (i. düğümün komşuları
+                  nbr[indptr[i]:indptr[i+1]] aralığındadır, G.neighbors() sırasıyla)
+    - nbr[p]    : p pozisyonundaki kenarın gittiği düğümün indeksi
+    - eta_beta[p]: p pozisyonundaki kenarın sezgisel çekiciliği (eta ** beta)
+    - rev[p]    : Ters yöndeki (v, u) kenarının pozisyonu (yoksa -1)
+    - gpos[p]   : Kenarın, bant genişliği filtresi uygulanmamış tüm yönlü kenarlar içindeki
+                  kanonik pozisyonu ('slots' uzunluğunda; bkz. feromon_deposu.PheromoneStore)
+
+    Feromonlar aynı pozisyonlarla indekslenen bir dizide tutulur. eta ** beta sadece
+    (ağırlıklar, min_bw) değiştiğinde hesaplanır; karınca adımları dilim çarpımıdır.
+
+    sort_by_eta=True ise her satır eta'ya göre azalan sırada dizilir; böylece bu (ağırlıklar, min_bw)
+    için bir düğümün en iyi k aday komşusu (candidate list) satırın ilk k pozisyonudur.
+    gpos kenarla birlikte taşındığından feromon deposu sıralamadan etkilenmez.
+
+    Returns:
+        dict: nodes, index, indptr, nbr, indptr_list, nbr_list, eta_beta, rev, gpos, slots
+    """
+    w_d, w_r, w_res = weights
+    nodes = list(graph.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+
+    indptr = [0]
+    nbr = []
+    eta = []
+    gpos = []
+    slot = -1   # Kanonik (filtresiz) kenar sayacı
+    edge_pos = {}
+    for u in nodes:
+        row = []
+        for v in graph.neighbors(u):
+            slot += 1
+            edge_data = graph[u][v]
+            if edge_data.get('bandwidth', 0) < min_bw:
+                continue
+            d = edge_data.get('delay', 1.0)        # Gecikme
+            r = edge_data.get('reliability', 0.99) # Güvenilirlik
+            bw = edge_data.get('bandwidth', 100)   # Bant Genişliği
+            if r <= 0: r = 0.0001
+            r_cost = -math.log(r)
+            res_cost = 1000.0/bw if bw > 0 else 1000.0
+            # Eta = 1 / Yerel maliyet (Maliyet ne kadar azsa çekicilik o kadar fazla).
+            local_cost = (w_d * d) + (w_r * r_cost) + (w_res * res_cost)
+            row.append((1.0 / local_cost if local_cost > 0 else 1.0, index[v], slot))
+        if sort_by_eta:
+            row.sort(key=lambda e: -e[0])
+        for eta_uv, v, g in row:
+            edge_pos[(index[u], v)] = len(nbr)
+            eta.append(eta_uv)
+            nbr.append(v)
+            gpos.append(g)
+        indptr.append(len(nbr))
+
+    rev = [edge_pos.get((v, u), -1) for (u, v) in sorted(edge_pos, key=edge_pos.get)]
+    return {
+        "nodes": nodes,
+        "index": index,
+        "indptr": np.array(indptr, dtype=np.int64),
+        "nbr": np.array(nbr, dtype=np.int64),
+        # Adım başına tek eleman okumaları için liste kopyaları (NumPy skaler erişimi yavaştır)
+        "indptr_list": indptr,
+        "nbr_list": nbr,
+        "eta_beta": np.array(eta, dtype=np.float64) ** beta,
+        "rev": np.array(rev, dtype=np.int64),
+        "gpos": np.array(gpos, dtype=np.int64),
+        "slots": slot + 1,
+    }
+
+
+class PheromoneTrail:
+    """
+    Buharlaşmalı feromon dizisi (CSR kenar pozisyonlarıyla indekslenir).
+
+    Hevesli (eager) mod: Her iterasyonda tüm dizi (1 - rho) ile çarpılır ve tau_min ile
+    sınırlanır. Tek bir vektör işlemidir ama kenar sayısıyla (O(E)) büyür.
+
+    Tembel (lazy) mod: Her CSR satırı (bir düğümün çıkan kenarları) için son güncellendiği
+    iterasyon (stamp) saklanır; buharlaşma sadece saati ilerletir. Satır okunduğunda veya
+    kenarlarından birine feromon bırakıldığında aradaki Δt buharlaşma tek seferde uygulanır:
+
+        tau = max(tau_min, tau * (1 - rho) ** Δt)
+
+    Buharlaşma ve tau_min sınırı monoton olduğu için iki mod aynı değerleri verir. Tembel
+    modda bir iterasyonun maliyeti sadece karıncaların dokunduğu satırlarla orantılıdır;
+    ancak satır başına sabit maliyeti vektör işleminin eleman başına maliyetinden çok
+    yüksektir. Bu yüzden sadece çok büyük graflarda (bkz. ACO_LAZY_EVAPORATION_MIN_EDGES) kazançlıdır.
+    """
+    def __init__(self, indptr, evaporation_rate, tau_min, initial=1.0, lazy=False, tau=None):
+        self.indptr = indptr   # CSR satır sınırları (liste)
+        # tau verilirse (ör. paylaşılan bellekteki dizi) başlangıç değeri yazılmadan kullanılır
+        self.tau = np.full(indptr[-1], initial, dtype=np.float64) if tau is None else tau
+        self.stamp = [0] * (len(indptr) - 1)   # Satırın değerlerinin geçerli olduğu iterasyon
+        # Her kenar pozisyonunun ait olduğu satır (düğüm indeksi)
+        self.owner = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr)).tolist()
+        self.now = 0   # Tembel modda şimdiye kadarki buharlaşma sayısı (hevesli modda hep 0)
+        self.keep = 1.0 - evaporation_rate
+        self.tau_min = tau_min
+        self.lazy = lazy
+
+    def evaporate(self):
+        """Bir iterasyonluk buharlaşma."""
+        if self.lazy:
+            # Sadece saat ilerletilir; satırlar okunduklarında güncellenir.
+            self.now += 1
+        else:
+            self.tau *= self.keep
+            np.maximum(self.tau, self.tau_min, out=self.tau)
+
+    def row(self, u):
+        """u düğümünün kenarlarının güncel feromon değerlerini (dizi görünümü) döndürür."""
+        seg = self.tau[self.indptr[u]:self.indptr[u + 1]]
+        dt = self.now - self.stamp[u]
+        if dt:
+            seg *= self.keep ** dt
+            np.maximum(seg, self.tau_min, out=seg)
+            self.stamp[u] = self.now
+        return seg
+
+    def values(self):
+        """Tüm kenarların güncel feromon değerleri (tembel modda bekleyen buharlaşma uygulanır)."""
+        if self.lazy:
+            for u, stamp in enumerate(self.stamp):
+                if stamp != self.now:
+                    self.row(u)
+        return self.tau
+
+    def add(self, p, amount, tau_max):
+        """p pozisyonundaki kenara feromon ekler ve tau_max ile sınırlar."""
+        u = self.owner[p]
+        if self.stamp[u] != self.now:
+            self.row(u)
+        self.tau[p] = min(tau_max, self.tau[p] + amount)
+
+
 class ACOSolver:
     """
     Ant Colony Optimization (ACO) Algoritması
     Karıncalar, feromon izlerini ve sezgisel bilgiyi (visibility) kullanarak yol seçer.
+
+    Feromonlar (PheromoneTrail, tembel buharlaşmalı) ve eta ** beta değerleri,
+    build_aco_arrays() ile kurulan CSR kenar pozisyonlarıyla indekslenen NumPy dizilerinde tutulur.
     """
     @staticmethod
-    def solve(graph, source, target, weights, min_bw, num_ants=20, num_iterations=30, seed=None):
-        if seed is not None:
-            random.seed(seed)
+    def solve(graph, source, target, weights, min_bw, num_ants=20, num_iterations=30, seed=None, rng=None,
+              lazy_evaporation=None, workers=ACO_WORKERS, candidates=ACO_CANDIDATES,
+              dynamic_tau_max=ACO_DYNAMIC_TAU_MAX, pheromone_store=None, graph_version=None, backtrack=None, max_backtracks=ACO_MAX_BACKTRACKS, tabu=True, stats=None):
+        # Çağrıya özel rastgele sayı üreteci (global 'random' durumu paylaşılmaz).
+        # rng verilmezse seed ile oluşturulur; eşzamanlı çözümler birbirinin dizisini bozmaz.
+        if rng is None:
+            rng = random.Random(seed)
+        # lazy_evaporation: True/False ile buharlaşma modu seçilir (bkz. PheromoneTrail);
+        # None ise kenar sayısı ACO_LAZY_EVAPORATION_MIN_EDGES'i aşan graflarda tembel mod kullanılır.
+        # workers: K > 1 ise her iterasyonun karıncaları K süreçte paralel yürür (bkz. _start_colony_pool).
+        # candidates: k verilirse satırlar bu talebin eta'sına göre sıralanır ve karınca önce en iyi
+        #       k komşu arasından seçer; adım maliyeti O(k) olur. Adayların hepsi ziyaret edilmişse
+        #       tüm komşulara bakılır (bkz. _ant_walk). None = ACO_CANDIDATES.
+        # dynamic_tau_max: True ise tau_max = Q / (evaporation_rate * C_best): En iyi yola her iterasyon
+        #       Q / C_best bırakılsaydı feromonun yaklaşacağı değer. C_best sadece azaldığından sınır
+        #       sadece büyür; dizi kırpılmaz. Yol bulunana kadar sabit tau_max kullanılır.
+        # pheromone_store: (Opsiyonel) feromon_deposu.PheromoneStore. Verilirse feromonlar aynı
+        #       (ağırlıklar, bant genişliği sınıfı) için önceki taleplerin sönümlenmiş değerleriyle
+        #       başlar ve çözüm sonunda depoya yazılır.
+        # graph_version: (Opsiyonel) q_tablosu.topology_version(graph). Verilmezse depo kullanılırken
+        #       çözüm başına bir kez hesaplanır; graf değişmeden çok talep çalıştıran çağrılar bir kez verir.
+        # backtrack: True ise çıkmaz sokağa giren karınca en fazla 'max_backtracks' kez geri izler
+        #       (bkz. _ant_walk); None = ACO_BACKTRACK.
+        # tabu: Geri izleme modunda bu talebin (hedef, min_bw) bilinen çıkmaz düğümleri öğrenilir ve
+        #       sonraki karıncalar bu düğümlere hiç girmez. Liste iterasyon başında anlık görüntü olarak
+        #       okunur, iterasyon sonunda birleştirilir (sonuç işçi sayısından bağımsızdır).
+        # stats: (Opsiyonel) dict. 'best_iteration' (global en iyinin bulunduğu iterasyon),
+        #       'warm_start' (depodan başlatıldı mı), 'successful_ants' (her iterasyonda hedefe ulaşan
+        #       karınca sayısı), 'useful_ants_per_second' (başarılı karınca / saniye) ve
+        #       'tabu_nodes' (öğrenilen çıkmaz düğüm sayısı) yazılır.
         # ----------------------------------------------------------------
         # 1. ACO PARAMETRELERİNİN TANIMLANMASI
         # ----------------------------------------------------------------
@@ -164,213 +371,391 @@ class ACOSolver:
         tau_max = 10.0        
 
         # ----------------------------------------------------------------
-        # 2. FEROMON HARİTASININ BAŞLATILMASI
+        # 2. FEROMON VE SEZGİSEL BİLGİ DİZİLERİNİN BAŞLATILMASI
         # ----------------------------------------------------------------
-        # Feromon değerlerini tutacak sözlük yapısı tanımlanır.
-        pheromones = {}
-        # Graftaki tüm kenarlar üzerinde döngü başlatılır.
-        for u, v in graph.edges():
-            # (u, v) yönü için başlangıç feromonu atanır (1.0).
-            pheromones[(u, v)] = 1.0
-            # (v, u) yönü için başlangıç feromonu atanır (Simetrik).
-            pheromones[(v, u)] = 1.0
+        # Geçerli kenarlar ve eta ** beta bu talep (ağırlıklar, min_bw) için bir kez hesaplanır.
+        arrays = build_aco_arrays(graph, weights, min_bw, beta, sort_by_eta=bool(candidates))
+        index = arrays["index"]
+        rev = arrays["rev"]
+        # Feromon dizisi: Her geçerli kenar pozisyonu için başlangıç feromonu (1.0).
+        if lazy_evaporation is None:
+            lazy_evaporation = len(arrays["nbr"]) >= ACO_LAZY_EVAPORATION_MIN_EDGES
+        if workers > 1:
+            # İşçiler feromonları paylaşılan bellekten güncel haliyle okur -> hevesli buharlaşma.
+            lazy_evaporation = False
+        pheromones = PheromoneTrail(arrays["indptr_list"], evaporation_rate, tau_min, lazy=lazy_evaporation)
+        # Sıcak başlangıç: Önceki taleplerin feromonlarının sönümlenmiş kopyası
+        warm = None
+        if pheromone_store is not None:
+            if graph_version is None:
+                graph_version = topology_version(graph)
+            warm = pheromone_store.warm_start(graph, weights, min_bw, arrays["gpos"], version=graph_version)
+            if warm is not None:
+                np.clip(warm, tau_min, tau_max, out=pheromones.tau)
+
+        # Geri izleme ve çıkmaz düğüm (tabu) listesi: Düğüm indeksi başına 1 bayt.
+        if backtrack is None:
+            backtrack = ACO_BACKTRACK
+        if not backtrack:
+            max_backtracks = 0
+        elif max_backtracks is None:
+            max_backtracks = len(arrays["nodes"])
+        tabu_nodes = np.zeros(len(arrays["nodes"]), dtype=np.uint8) if max_backtracks and tabu else None
+        # Yönsüz grafta geldiği kenar dışında çıkışı olmayan düğüm de çıkmazdır.
+        dead_limit = 0 if graph.is_directed() else 1
+        walk_options = {"backtracks": max_backtracks, "tabu": tabu_nodes, "dead_limit": dead_limit,
+                        "candidates": candidates}
+        # Bulunma sırasıyla çıkmaz düğümler (paralel modda işçiler kendi kopyalarını bununla günceller)
+        known_dead = []
+        # Her iterasyonda hedefe ulaşan karınca sayısı (verim ölçüsü)
+        successful_ants = []
 
         # Global en iyi yol değişkeni (Başlangıçta yok).
         global_best_path = None
         # Global en iyi maliyet değişkeni (Başlangıçta sonsuz).
         global_best_cost = float('inf')
+        # Global en iyinin bulunduğu iterasyon (yakınsama hızı ölçüsü)
+        best_iteration = None
 
         # Algoritma başlangıç zamanı kaydedilir.
         start_time = time.time()
 
+        # Kaynak veya hedef grafta yoksa hiçbir karınca yola çıkamaz.
+        if source not in index or target not in index:
+            if stats is not None:
+                stats.update(best_iteration=None, warm_start=warm is not None, successful_ants=[],
+                             useful_ants_per_second=0.0, tabu_nodes=0)
+            return global_best_path, global_best_cost, (time.time() - start_time) * 1000
+
         # ----------------------------------------------------------------
         # 3. İTERASYON DÖNGÜSÜ (EĞİTİM)
         # ----------------------------------------------------------------
-        # Belirlenen iterasyon sayısı kadar döngü çalıştırılır.
-        for iteration in range(num_iterations):
-            # Bu iterasyonda bulunan tüm yolları ve maliyetlerini tutacak liste.
-            paths_in_iteration = []
-
-            # ------------------------------------------------------------
-            # 4. KARINCA KOLONİSİ DÖNGÜSÜ
-            # ------------------------------------------------------------
-            # Her iterasyonda 'num_ants' kadar karınca yola çıkarılır.
-            for ant in range(num_ants):
-                # Karınca, kaynaktan hedefe bir yol bulmak için _ant_walk fonksiyonunu çağırır.
-                path = ACOSolver._ant_walk(graph, source, target, pheromones, alpha, beta, min_bw, weights)
-                
-                # Eğer karınca başarılı bir şekilde hedefe ulaştıysa (yol boş değilse):
-                if path:
-                    # Bulunan yolun toplam QoS maliyeti hesaplanır.
-                    cost = calculate_total_cost(graph, path, weights)
-                    # Yol ve maliyet, bu iterasyonun listesine eklenir.
-                    paths_in_iteration.append((path, cost))
-                    
-                    # Eğer bulunan maliyet, şu ana kadarki en iyi maliyetten düşükse:
-                    if cost < global_best_cost:
-                        # Global en iyi maliyet güncellenir.
-                        global_best_cost = cost
-                        # Global en iyi yol güncellenir (Listenin kopyası alınır).
-                        global_best_path = list(path)
-
-            # ------------------------------------------------------------
-            # 5. FEROMON BUHARLAŞMASI (EVAPORATION)
-            # ------------------------------------------------------------
-            # Mevcut tüm feromon yolları (kenarları) üzerinde döngü.
-            for key in pheromones:
-                # Mevcut feromon miktarı, buharlaşma oranı kadar azaltılır.
-                pheromones[key] *= (1.0 - evaporation_rate)
-                
-                # Eğer feromon miktarı minimum sınırın altına düştüyse:
-                if pheromones[key] < tau_min: 
-                    # Minimum sınıra (tau_min) eşitlenir.
-                    pheromones[key] = tau_min
-
-            # ------------------------------------------------------------
-            # 6. FEROMON GÜNCELLEMESİ (DEPOSIT - YERELEL)
-            # ------------------------------------------------------------
-            # Bu iterasyonda bulunan başarılı yollar üzerinde döngü.
-            for path, cost in paths_in_iteration:
-                # Bırakılacak feromon miktarı hesaplanır (Maliyet ne kadar azsa, feromon o kadar çok).
-                # Eğer maliyet 0 veya negatifse (teorik), sabit Q kullanılır.
-                deposit = Q / cost if cost > 0 else Q
-                
-                # Yol üzerindeki her bir kenar (bağlantı) için döngü.
-                for i in range(len(path) - 1):
-                    # Kenarın başlangıç (u) ve bitiş (v) düğümleri alınır.
-                    u, v = path[i], path[i+1]
-                    
-                    # (u, v) yönündeki feromona deposit miktarı eklenir.
-                    # Maksimum sınır (tau_max) kontrolü yapılır.
-                    pheromones[(u, v)] = min(tau_max, pheromones[(u, v)] + deposit) 
+        start, end = index[source], index[target]
+        pool = None
+        blocks = []
+        if workers > 1:
+            pool, blocks = ACOSolver._start_colony_pool(graph, arrays, pheromones, workers,
+                                                        alpha, evaporation_rate, tau_min, weights,
+                                                        walk_options)
+        try:
+            # Belirlenen iterasyon sayısı kadar döngü çalıştırılır.
+            for iteration in range(num_iterations):
+                # Bu iterasyonda bulunan tüm yolları, maliyetlerini ve kenar pozisyonlarını tutacak liste.
+                paths_in_iteration = []
+                # Bu iterasyonda karıncaların bulduğu yeni çıkmaz düğümler (iterasyon sonunda eklenir).
+                dead_ends = []
+
+                # ------------------------------------------------------------
+                # 4. KARINCA KOLONİSİ DÖNGÜSÜ
+                # ------------------------------------------------------------
+                # Her iterasyonda 'num_ants' kadar karınca yola çıkarılır.
+                # Her karıncanın tohumu sırayla çekilir ve karınca kendi üretecini kullanır; böylece
+                # seri ve paralel modlar aynı seed için aynı yürüyüşleri üretir.
+                ant_seeds = [rng.getrandbits(64) for ant in range(num_ants)]
+                if pool is None:
+                    # Kümülatif çekicilik satırları bu iterasyonun karıncaları arasında paylaşılır.
+                    samplers = {}
+                    # Karınca, kaynaktan hedefe bir yol bulur ve yolun toplam QoS maliyetini hesaplar.
+                    walks = (ACOSolver._run_ant(graph, arrays, start, end, pheromones, alpha, weights,
+                                                random.Random(ant_seed), samplers, dead_ends=dead_ends,
+                                                **walk_options)
+                             for ant_seed in ant_seeds)
+                else:
+                    # Paralel: Sonuçlar karınca sırasıyla döner.
+                    tasks = [(ant_seed, start, end, iteration, known_dead) for ant_seed in ant_seeds]
+                    results = pool.map(run_file_task, tasks, chunksize=-(-num_ants // workers))
+                    walks = [walk for walk, _ in results]
+                    for _, found in results:
+                        dead_ends.extend(found)
+
+                successful_ants.append(0)
+
+                for walk in walks:
+                    # Eğer karınca başarılı bir şekilde hedefe ulaştıysa (yol boş değilse):
+                    if walk:
+                        successful_ants[-1] += 1
+                        path, positions, cost = walk
+                        # Yol ve maliyet, bu iterasyonun listesine eklenir.
+                        paths_in_iteration.append((positions, cost))
                     
-                    # (v, u) yönündeki feromona da aynı miktar eklenir (Yönsüz graf varsayımı).
-                    pheromones[(v, u)] = min(tau_max, pheromones[(v, u)] + deposit)
-
-            # ------------------------------------------------------------
-            # 7. ELİTİST FEROMON GÜNCELLEMESİ (GLOBAL BEST)
-            # ------------------------------------------------------------
-            # Eğer şimdiye kadar bulunmuş en iyi bir yol varsa:
-            if global_best_path:
-                # En iyi yol için ekstra ödül feromonu hesaplanır (2 kat etkili).
-                deposit = (Q / global_best_cost) * 2.0 
-                
-                # En iyi yolun kenarları üzerinde döngü.
-                for i in range(len(global_best_path) - 1):
-                    u, v = global_best_path[i], global_best_path[i+1]
-                    # Kenarlara ekstra feromon eklenir ve sınır kontrolü yapılır.
-                    pheromones[(u, v)] = min(tau_max, pheromones[(u, v)] + deposit)
-                    pheromones[(v, u)] = min(tau_max, pheromones[(v, u)] + deposit)
+                        # Eğer bulunan maliyet, şu ana kadarki en iyi maliyetten düşükse:
+                        if cost < global_best_cost:
+                            # Global en iyi maliyet güncellenir.
+                            global_best_cost = cost
+                            # Global en iyi yol ve kenar pozisyonları güncellenir.
+                            global_best_path = path
+                            global_best_positions = positions
+                            best_iteration = iteration
+
+                # ------------------------------------------------------------
+                # 5. FEROMON BUHARLAŞMASI (EVAPORATION)
+                # ------------------------------------------------------------
+                # Feromon miktarı buharlaşma oranı kadar azaltılır ve tau_min ile sınırlanır.
+                # Tembel modda sadece iterasyon sayacı ilerler; her satırın birikmiş buharlaşması
+                # o satır okunduğunda veya güncellendiğinde uygulanır.
+                pheromones.evaporate()
+
+                # Öğrenilen çıkmaz düğümler sonraki iterasyonun karıncalarına açılır.
+                if tabu_nodes is not None:
+                    for v in dead_ends:
+                        if not tabu_nodes[v]:
+                            tabu_nodes[v] = 1
+                            known_dead.append(v)
+
+                # Dinamik üst sınır: En iyi maliyet iyileştikçe büyür (bırakma sırasında uygulanır).
+                if dynamic_tau_max and global_best_path and global_best_cost > 0:
+                    tau_max = Q / (evaporation_rate * global_best_cost)
+
+                # ------------------------------------------------------------
+                # 6. FEROMON GÜNCELLEMESİ (DEPOSIT - YERELEL)
+                # ------------------------------------------------------------
+                # Bu iterasyonda bulunan başarılı yollar üzerinde döngü.
+                for positions, cost in paths_in_iteration:
+                    # Bırakılacak feromon miktarı hesaplanır (Maliyet ne kadar azsa, feromon o kadar çok).
+                    # Eğer maliyet 0 veya negatifse (teorik), sabit Q kullanılır.
+                    deposit = Q / cost if cost > 0 else Q
+                    ACOSolver._deposit(pheromones, rev, positions, deposit, tau_max)
+
+                # ------------------------------------------------------------
+                # 7. ELİTİST FEROMON GÜNCELLEMESİ (GLOBAL BEST)
+                # ------------------------------------------------------------
+                # Eğer şimdiye kadar bulunmuş en iyi bir yol varsa:
+                if global_best_path:
+                    # En iyi yol için ekstra ödül feromonu hesaplanır (2 kat etkili).
+                    deposit = (Q / global_best_cost) * 2.0 
+                    ACOSolver._deposit(pheromones, rev, global_best_positions, deposit, tau_max)
+
+            # Son feromonlar sonraki talepler için depoya yazılır.
+            if pheromone_store is not None:
+                pheromone_store.save(graph, weights, min_bw, arrays["gpos"], arrays["slots"],
+                                     pheromones.values(), version=graph_version)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+                # Paylaşılan feromon bloğu kapatılmadan önce üzerindeki görünüm bırakılır.
+                pheromones.tau = None
+                for shm in blocks:
+                    shm.close()
+                    shm.unlink()
 
         # Toplam geçen süre milisaniye cinsinden hesaplanır.
         elapsed = (time.time() - start_time) * 1000
+        if stats is not None:
+            stats.update(best_iteration=best_iteration, warm_start=warm is not None,
+                         successful_ants=successful_ants,
+                         useful_ants_per_second=sum(successful_ants) / max(elapsed / 1000, 1e-9),
+                         tabu_nodes=len(known_dead))
         # En iyi yol, en iyi maliyet ve geçen süre döndürülür.
         return global_best_path, global_best_cost, elapsed
 
     @staticmethod
-    def _ant_walk(graph, start_node, end_node, pheromones, alpha, beta, min_bw, weights):
-        """Tek bir karıncanın kaynaktan hedefe yürüyüşü."""
+    def _start_colony_pool(graph, arrays, pheromones, workers, alpha, evaporation_rate, tau_min, weights,
+                           walk_options=None):
+        """
+        Paralel karınca yürüyüşleri için süreç havuzunu başlatır.
+
+        - Graf (maliyet hesabı için) ve CSR dizileri paylaşılan belleğe bir kez yazılır.
+        - Feromon dizisi de paylaşılan belleğe taşınır: Ana süreç iterasyon aralarında
+          (buharlaşma ve bırakma) günceller, işçiler yürüyüş sırasında kopyasız okur.
+
+        Returns:
+            tuple: (havuz, kapatılacak SharedMemory blokları)
+        """
+        blocks, graph_spec = share_graph(graph)
+        refs = {}
+        for key in ("indptr", "nbr", "eta_beta", "tau"):
+            shm, refs[key] = share_array(pheromones.tau if key == "tau" else arrays[key])
+            blocks.append(shm)
+        # Ana sürecin feromon dizisi paylaşılan blok üzerindeki görünümle değiştirilir
+        pheromones.tau = np.ndarray(pheromones.tau.shape, dtype=pheromones.tau.dtype, buffer=blocks[-1].buf)
+
+        params = {"alpha": alpha, "evaporation_rate": evaporation_rate,
+                  "tau_min": tau_min, "weights": weights,
+                  "walk_options": walk_options or {}}
+        pool = file_worker_pool(workers, (os.path.abspath(__file__), "_init_aco_worker"),
+                                (graph_spec, refs, params))
+        return pool, blocks
+
+    @staticmethod
+    def _run_ant(graph, arrays, start, end, pheromones, alpha, weights, rng, samplers=None, **walk_options):
+        """
+        Tek karıncayı yürütür ve bulduğu yolun maliyetini hesaplar.
+        samplers: İterasyonun kümülatif satır önbelleği; walk_options: geri izleme ayarları (bkz. _ant_walk).
+
+        Returns:
+            tuple: (düğüm yolu, kenar pozisyonları, maliyet) veya başarısızlıkta None
+        """
+        walk = ACOSolver._ant_walk(arrays, start, end, pheromones, alpha, rng, samplers, **walk_options)
+        if not walk:
+            return None
+        path, positions = walk
+        return path, positions, calculate_total_cost(graph, path, weights)
+
+    @staticmethod
+    def _deposit(pheromones, rev, positions, deposit, tau_max):
+        """Yolun kenarlarına (her iki yönde) feromon ekler ve tau_max ile sınırlar."""
+        for p in positions:
+            # (u, v) yönündeki feromona deposit miktarı eklenir.
+            pheromones.add(p, deposit, tau_max)
+            # (v, u) yönündeki feromona da aynı miktar eklenir (Yönsüz graf varsayımı).
+            q = rev[p]
+            if q >= 0:
+                pheromones.add(q, deposit, tau_max)
+
+    @staticmethod
+    def _ant_walk(arrays, start, end, pheromones, alpha, rng, samplers=None,
+                  backtracks=0, tabu=None, dead_limit=1, dead_ends=None, candidates=None):
+        """
+        Tek bir karıncanın kaynaktan hedefe yürüyüşü (düğüm indeksleri üzerinden).
+
+        samplers: (Opsiyonel) dict. Feromonlar iterasyon boyunca değişmediği için bir düğümün
+        kümülatif çekicilik satırı (ornekleme.CumulativeSampler) iterasyonun ilk karıncası
+        tarafından kurulur ve aynı iterasyondaki tüm karıncalar tarafından tekrar kullanılır.
+        Her iterasyonda yeni (boş) bir sözlük verilmelidir.
+
+        candidates: (Opsiyonel) k. Satırlar eta'ya göre sıralıyken (build_aco_arrays, sort_by_eta)
+        önce satırın ilk k kenarı (aday listesi) değerlendirilir; satır kurulumu O(k) olur.
+        Adayların hepsi ziyaret edilmişse tüm satıra bakılır (önbellekte ~düğüm anahtarıyla).
+
+        backtracks: Geri izleme hakkı. Çıkmaz sokakta yürüyüş hemen atılmaz; karınca (hakkı
+        bitene kadar) denenmemiş komşusu kalan son düğüme geri döner. Bırakılan düğüm ziyaret
+        edilmiş sayılmaya devam eder ve bu karınca tarafından bir daha denenmez (her düğüm en
+        fazla bir kez bırakılır). Kaynak da bırakılırsa yürüyüş başarısızdır.
+        tabu: (Opsiyonel) düğüm indeksi başına 0/1 dizisi - bu talep için bilinen çıkmaz düğümler;
+        karınca bunlara hiç girmez. Geri izlerken bırakılan düğümün tabu olmayan komşu sayısı
+        dead_limit'i aşmıyorsa (yönsüz grafta sadece geldiği komşu) düğüm her yol için çıkmazdır ve
+        dead_ends listesine eklenir. Kaynak ve hedef hiçbir zaman çıkmaz sayılmaz.
+
+        Returns:
+            tuple: (düğüm yolu, kullanılan kenar pozisyonları) veya başarısızlıkta None
+        """
+        nodes = arrays["nodes"]
+        indptr = arrays["indptr_list"]
+        nbr_list = arrays["nbr_list"]
+        eta_beta = arrays["eta_beta"]
+        # Tembel buharlaşma: Satır sadece bu iterasyonda ilk okunduğunda güncellenir (hevesli modda hiç).
+        tau_all = pheromones.tau
+        stamp = pheromones.stamp
+        now = pheromones.now
+        if samplers is None:
+            samplers = {}
+
+        def sampler_row(node, lo, hi):
+            # Olasılık Formülü: P ~ (tau^alpha) * (eta^beta), tek dilim çarpımı.
+            if stamp[node] != now:
+                pheromones.row(node)
+            tau = tau_all[lo:hi]
+            attractiveness = (tau if alpha == 1.0 else tau ** alpha) * eta_beta[lo:hi]
+            return CumulativeSampler(attractiveness.tolist()), nbr_list[lo:hi]
+
         # Karıncanın şu anki konumu başlangıç düğümüne atanır.
-        current_node = start_node
-        # Karıncanın izlediği yol listesi başlatılır.
-        path = [current_node]
-        # Ziyaret edilen düğümler kümesi oluşturulur (Döngüleri önlemek için).
-        visited = set(path)
-        # Ağırlıklar (Gecikme, Güvenilirlik, Kaynak) değişkenlere atanır.
-        w_d, w_r, w_res = weights
+        current = start
+        # Karıncanın izlediği yol ve kullandığı kenar pozisyonları.
+        path = [current]
+        positions = []
+        # Ziyaret edilen düğümler (Döngüleri önlemek için). Bilinen çıkmaz düğümler baştan işaretlidir.
+        if tabu is not None:
+            known_dead = bytearray(tabu)
+            visited = bytearray(known_dead)
+        else:
+            visited = bytearray(len(nodes))
+        visited[current] = 1
 
         # Hedefe ulaşılmadığı sürece döngü devam eder.
-        while current_node != end_node:
-            # Mevcut düğümün tüm komşuları alınır.
-            neighbors = list(graph.neighbors(current_node))
-            # Geçerli (gidilebilir) komşuları tutacak liste.
-            valid_neighbors = []
-            
-            # Tüm komşular kontrol edilir.
-            for n in neighbors:
-                # Eğer komşu daha önce ziyaret edildiyse atla (Döngü önleme).
-                if n in visited: continue
-                # Kenarın bant genişliği değeri alınır.
-                edge_bw = graph[current_node][n].get('bandwidth', 0)
-                # Eğer bant genişliği minimum gereksinimi karşılıyorsa:
-                if edge_bw >= min_bw:
-                    # Komşuyu geçerli listesine ekle.
-                    valid_neighbors.append(n)
-
-            # ----------------------------------------------------------------
-            # ÇIKMAZ SOKAK (DEAD END) KONTROLÜ
-            # ----------------------------------------------------------------
-            # Eğer gidilecek hiçbir geçerli komşu yoksa:
-            if not valid_neighbors:
-                # Başarısızlık (None) döndür ve işlemi bitir.
-                return None 
-
-            # ----------------------------------------------------------------
-            # SEÇİM OLASILIKLARININ HESAPLANMASI
-            # ----------------------------------------------------------------
-            # Her komşu için seçim olasılığını tutacak liste.
-            probabilities = []
-            # Olasılıkların toplamı (Payda).
-            denominator = 0.0
-
-            # Her geçerli komşu için olasılık hesabı yapılır.
-            for neighbor in valid_neighbors:
-                # Tau: Feromon miktarı (Geçmiş tecrübe).
-                # Eğer kenarda feromon yoksa varsayılan 1.0 alınır.
-                tau = pheromones.get((current_node, neighbor), 1.0)
-                
-                # Kenar verileri graf'tan çekilir.
-                edge_data = graph[current_node][neighbor]
-                d = edge_data.get('delay', 1.0)        # Gecikme
-                r = edge_data.get('reliability', 0.99) # Güvenilirlik
-                bw = edge_data.get('bandwidth', 100)   # Bant Genişliği
-                
-                # Eta: Sezgisel çekicilik (Maliyetin tersi - Görünürlük).
-                # Güvenilirlik logaritmik maliyete çevrilir.
-                if r <= 0: r = 0.0001
-                r_cost = -math.log(r)
-                # Kaynak maliyeti hesaplanır (1000/BW).
-                res_cost = 1000.0/bw if bw > 0 else 1000.0
-                
-                # Yerel maliyet (Local Cost) hesaplanır.
-                local_cost = (w_d * d) + (w_r * r_cost) + (w_res * res_cost)
-                # Eta = 1 / Maliyet (Maliyet ne kadar azsa çekicilik o kadar fazla).
-                eta = 1.0 / local_cost if local_cost > 0 else 1.0
-                
-                # Olasılık Formülü: P = (tau^alpha) * (eta^beta)
-                # alpha: Feromonun etkisi, beta: Sezgisel bilginin etkisi.
-                prob = (tau ** alpha) * (eta ** beta)
-                
-                # Hesaplanan olasılık listeye eklenir.
-                probabilities.append(prob)
-                # Toplam olasılığa eklenir.
-                denominator += prob
-
-            # Eğer toplam olasılık 0 ise (Matematiksel hata veya imkansız durum):
-            if denominator == 0: return None
-            
-            # ----------------------------------------------------------------
-            # ROULETTE WHEEL SELECTION (BİR SONRAKİ DÜĞÜMÜ SEÇME)
-            # ----------------------------------------------------------------
-            # Olasılıklar normalize edilir (Toplamları 1 olacak şekilde).
-            probabilities = [p / denominator for p in probabilities]
-            
-            # random.choices ile ağırlıklı rastgele seçim yapılır.
-            # Seçilen komşu 'next_node' olur.
-            next_node = random.choices(valid_neighbors, weights=probabilities, k=1)[0]
-            
-            # Seçilen düğüm yola eklenir.
-            path.append(next_node)
-            # Seçilen düğüm ziyaret edilenler kümesine eklenir.
-            visited.add(next_node)
-            # Karıncanın konumu güncellenir.
-            current_node = next_node
+        while current != end:
+            lo = indptr[current]
+            row = samplers.get(current)
+            if row is None:
+                hi = indptr[current + 1]
+                # Aday listesi: Satır sıralı olduğundan en iyi k komşu satırın başıdır.
+                if candidates and hi - lo > candidates:
+                    hi = lo + candidates
+                row = samplers[current] = sampler_row(current, lo, hi)
+            sampler, neighbors = row
+
+            # ROULETTE WHEEL SELECTION: Kümülatif toplam üzerinde ikili arama.
+            # Ziyaret edilmiş komşular seçilemez (çekicilikleri sıfır sayılır).
+            k = sampler.sample_unblocked(rng, neighbors, visited)
+            # Adayların hepsi ziyaret edilmişse satırın tamamından seçilir.
+            if k is None and candidates and len(neighbors) < indptr[current + 1] - lo:
+                row = samplers.get(~current)
+                if row is None:
+                    row = samplers[~current] = sampler_row(current, lo, indptr[current + 1])
+                sampler, neighbors = row
+                k = sampler.sample_unblocked(rng, neighbors, visited)
+            # ÇIKMAZ SOKAK (DEAD END) KONTROLÜ: Gidilecek geçerli komşu yoksa başarısız.
+            if k is None:
+                if not backtracks: return None
+                backtracks -= 1
+                # Düğümün (yoldan bağımsız olarak) çıkışı kalmadıysa tabu listesine eklenir.
+                if (tabu is not None and current != start
+                        and sum(1 for v in neighbors if not known_dead[v]) <= dead_limit):
+                    known_dead[current] = 1
+                    if dead_ends is not None:
+                        dead_ends.append(current)
+                # Geri izleme: Bir önceki düğüme dönülür (bırakılan düğüm ziyaret edilmiş kalır).
+                path.pop()
+                if not path: return None
+                positions.pop()
+                current = path[-1]
+                continue
+
+            pos = lo + k
+            current = neighbors[k]
+            # Seçilen düğüm yola ve ziyaret edilenlere eklenir.
+            path.append(current)
+            positions.append(pos)
+            visited[current] = 1
             
             # Sonsuz döngü koruması (Çok uzun yolları engellemek için).
             if len(path) > 250: return None 
 
-        # Hedefe ulaşıldığında oluşturulan yol döndürülür.
-        return path
+        # Hedefe ulaşıldığında yol, düğüm ID'lerine çevrilerek döndürülür.
+        return [nodes[i] for i in path], positions
+
+
+# =================================================================================================
+# PARALEL KARINCA YÜRÜYÜŞLERİ (İŞÇİ SÜREÇ)
+# =================================================================================================
+# Bir iterasyondaki karıncalar aynı feromon anlık görüntüsünü okur ve birbirinden bağımsızdır.
+# İşçiler ada_modeli.file_worker_pool ile bu dosyadan yüklenir; her karıncanın tohumu ana
+# süreçte çekilir ve feromon bırakma ana süreçte yapılır. Sonuç işçi sayısından bağımsızdır.
+def _init_aco_worker(graph_spec, refs, params):
+    """İşçi başlatıcısı: Graf ve dizilere bir kez bağlanır, karınca görev fonksiyonunu döndürür."""
+    G = attach_graph(graph_spec)
+    arrays = {"nodes": graph_spec["nodes"]}
+    blocks = []   # İşçi yaşadıkça açık kalır (görünümler bloklara bağlıdır)
+    for key, ref in refs.items():
+        shm, arrays[key] = attach_array(ref)
+        blocks.append(shm)
+    arrays["indptr_list"] = arrays["indptr"].tolist()
+    arrays["nbr_list"] = arrays["nbr"].tolist()
+    pheromones = PheromoneTrail(arrays["indptr_list"], params["evaporation_rate"],
+                                params["tau_min"], tau=arrays.pop("tau"))
+
+    # Kümülatif satır önbelleği: İşçi yeni bir iterasyonun karıncasını aldığında boşaltılır.
+    cache = {"iteration": None, "samplers": {}}
+    walk_options = dict(params["walk_options"])
+    tabu = walk_options.get("tabu")
+    applied = [0]   # İşçinin tabu kopyasına eklenmiş çıkmaz düğüm sayısı
+
+    def run_ant(task):
+        ant_seed, start, end, iteration, known_dead = task
+        if cache["iteration"] != iteration:
+            cache["iteration"], cache["samplers"] = iteration, {}
+        # Ana sürecin iterasyon başındaki çıkmaz düğüm listesi işçinin kopyasına uygulanır.
+        if tabu is not None and len(known_dead) > applied[0]:
+            tabu[known_dead[applied[0]:]] = 1
+            applied[0] = len(known_dead)
+        dead_ends = []
+        walk = ACOSolver._run_ant(G, arrays, start, end, pheromones, params["alpha"],
+                                  params["weights"], random.Random(ant_seed), cache["samplers"],
+                                  dead_ends=dead_ends, **walk_options)
+        return walk, dead_ends
+
+    run_ant.blocks = blocks
+    return run_ant
 
 
 # =================================================================================================
@@ -382,40 +767,74 @@ class GASolver:
     Popülasyon tabanlı evrimsel yaklaşım.
     """
     @staticmethod
-    def solve(graph, source, target, weights, min_bw, population_size=40, generations=30, seed=None):
-        if seed is not None:
-            random.seed(seed)
+    def solve(graph, source, target, weights, min_bw, population_size=40, generations=30, seed=None, rng=None,
+              fitness_cache=None, initial_population=None, population_out=None,
+              stagnation_limit=GA_STAGNATION_LIMIT, min_diversity=GA_MIN_DIVERSITY,
+              time_budget_ms=None, stats=None, steady_state=False, best_history=None):
+        # initial_population: Başlangıç popülasyonuna önce eklenecek yollar (ada modelinde
+        #                     önceki dönemin popülasyonu ve göçmenler); eksik kalanlar rastgele üretilir.
+        # population_out: Verilirse son popülasyon maliyete göre sıralı (yol, maliyet) olarak eklenir.
+        # stagnation_limit: Global en iyi bu kadar nesil boyunca iyileşmezse evrim durdurulur (None = kapalı).
+        # min_diversity: Farklı yol sayısı bu değerin altına inerse (popülasyon çöktü) durdurulur (None = kapalı).
+        # time_budget_ms: (Opsiyonel) Süre bütçesi; dolunca o ana kadarki en iyi yol döndürülür.
+        # stats: (Opsiyonel) dict. Verilirse 'stop_reason' ("generations", "stagnation",
+        #        "diversity", "time_budget", "no_path") ve 'generations_run' yazılır.
+        # steady_state: True ise kararlı durum modu (bkz. _evolve_steady_state).
+        # best_history: (Opsiyonel) list. En iyi maliyet her iyileştiğinde (adım, maliyet) eklenir.
+        # Çağrıya özel rastgele sayı üreteci (ACOSolver.solve ile aynı kural)
+        if rng is None:
+            rng = random.Random(seed)
+        # Fitness önbelleği: Ebeveynin aynısı olan çocuklar ve tekrar eden yollar yeniden
+        # hesaplanmaz. Aynı talebin tekrarlarında dışarıdan tek bir önbellek verilebilir.
+        if fitness_cache is None:
+            fitness_cache = FitnessCache()
+        fitness_cache.bind((min_bw, tuple(weights)))
+
+        def fitness(path):
+            return fitness_cache.get(path, lambda p: calculate_total_cost(graph, p, weights))
+
         # Algoritma başlangıç zamanı kaydedilir.
         start_time = time.time()
         
-        # 1. BAŞLANGIÇ POPÜLASYONU ÜRETİMİ
-        # Popülasyonu tutacak liste oluşturulur.
-        population = []
-        attempts = 0 # Sonsuz döngüden kaçınmak için deneme sayacı.
-        
-        # Hedeflenen popülasyon boyutuna ulaşana kadar rastgele yollar üretilir.
-        # Maksimum deneme sayısı: Popülasyon boyutu * 5
-        while len(population) < population_size and attempts < population_size * 5:
-            # Rastgele bir yol üretmek için yardımcı fonksiyon çağrılır.
-            path = GASolver._random_path(graph, source, target, min_bw)
-            
-            # Eğer geçerli bir yol bulunursa:
-            if path:
-                # Yolun maliyeti hesaplanır.
-                cost = calculate_total_cost(graph, path, weights)
-                # Yol ve maliyeti popülasyona eklenir.
-                population.append((path, cost))
-            attempts += 1
-            
-        # Eğer hiç başlangıç yolu bulunamazsa (Popülasyon boşsa):
-        if not population:
+        # Kısıtlı yol üreticisi: Sadece min_bw'yi sağlayan ve hedefe ulaşabilen düğümler üzerinde
+        # yürür. Her çekiliş döngüsüz, geçerli bir yol verir (çıkmaz sokak veya ret yoktur).
+        walker = ConstrainedWalker(graph, target, min_bw)
+
+        # Kaynak hedefe geçerli kenarlarla ulaşamıyorsa hiçbir yol üretilemez:
+        if not walker.can_reach(source):
+            if stats is not None:
+                stats.update(stop_reason="no_path", generations_run=0)
             # Başarısızlık döndürülür.
             return None, float('inf'), (time.time() - start_time) * 1000
 
+        # 1. BAŞLANGIÇ POPÜLASYONU ÜRETİMİ
+        # Verilen başlangıç yolları alınır, kalan yerler için tam olarak gereken sayıda rastgele yol üretilir.
+        population = [(list(p), fitness(p)) for p in (initial_population or [])][:population_size]
+        for _ in range(population_size - len(population)):
+            # Rastgele bir yol üretmek için yardımcı fonksiyon çağrılır.
+            path = GASolver._random_path(walker, source, rng)
+            # Yolun maliyeti hesaplanır (önbellekten) ve popülasyona eklenir.
+            population.append((path, fitness(path)))
+
+        # KARARLI DURUM (STEADY-STATE) MODU
+        if steady_state:
+            best_path, best_cost, final, stop_reason, generations_run = GASolver._evolve_steady_state(
+                population, population_size, generations, walker, fitness, rng,
+                stagnation_limit, time_budget_ms, start_time, best_history)
+            if population_out is not None:
+                population_out.extend(final)
+            if stats is not None:
+                stats.update(stop_reason=stop_reason, generations_run=generations_run)
+            return best_path, best_cost, (time.time() - start_time) * 1000
+
         # Global en iyi yol ve maliyet başlatılır.
         global_best_path = None
         global_best_cost = float('inf')
 
+        stop_reason = "generations"
+        stale = 0            # Global en iyinin iyileşmediği ardışık nesil sayısı
+        generations_run = 0
+
         # 2. EVRİM DÖNGÜSÜ (GENERATIONS)
         for gen in range(generations):
             # Popülasyonu maliyete göre (küçükten büyüğe) sırala.
@@ -427,6 +846,24 @@ class GASolver:
                 # Global en iyi güncellenir.
                 global_best_path = population[0][0]
                 global_best_cost = population[0][1]
+                stale = 0
+                if best_history is not None:
+                    best_history.append((gen, global_best_cost))
+            else:
+                stale += 1
+
+            # ERKEN DURDURMA:
+            # Yakınsamış bir popülasyonda kalan nesiller aynı yolları yeniden üretir.
+            if stagnation_limit is not None and stale >= stagnation_limit:
+                stop_reason = "stagnation"
+                break
+            if min_diversity is not None and len({tuple(p) for p, _ in population}) < min_diversity:
+                stop_reason = "diversity"
+                break
+            if time_budget_ms is not None and (time.time() - start_time) * 1000 >= time_budget_ms:
+                stop_reason = "time_budget"
+                break
+            generations_run += 1
 
             # ELİTİZM (Seçkincilik):
             # En iyi performansı gösteren %10'luk dilim, hiçbir değişikliğe uğramadan
@@ -436,116 +873,190 @@ class GASolver:
             # Yeni nesil popülasyon boyutu tamamlanana kadar döngü devam eder.
             while len(new_population) < population_size:
                 # SEÇİM (Selection): Turnuva yöntemiyle iki ebeveyn seçilir.
-                parent1 = GASolver._tournament_selection(population)
-                parent2 = GASolver._tournament_selection(population)
+                parent1 = GASolver._tournament_selection(population, rng)
+                parent2 = GASolver._tournament_selection(population, rng)
                 
                 # ÇAPRAZLAMA (Crossover):
                 # Ebeveynlerin genleri (yol parçaları) birleştirilerek çocuk oluşturulur.
-                child_path = GASolver._crossover(parent1[0], parent2[0])
+                child_path = GASolver._crossover(parent1[0], parent2[0], rng)
                 
                 # MUTASYON (Mutation):
                 # Çeşitliliği korumak için %20 ihtimalle rastgele değişim uygulanır.
-                if random.random() < 0.2: 
-                    child_path = GASolver._mutate(graph, child_path, min_bw)
+                if rng.random() < 0.2: 
+                    child_path = GASolver._mutate(walker, child_path, rng)
                 
                 # Oluşturulan çocuk geçerli ise:
                 if child_path:
-                    # Çocuğun maliyeti hesaplanır.
-                    cost = calculate_total_cost(graph, child_path, weights)
+                    # Çocuğun maliyeti hesaplanır (ebeveynle aynıysa önbellekten gelir).
+                    cost = fitness(child_path)
                     # Yeni popülasyona eklenir.
                     new_population.append((child_path, cost))
             
             # Eski popülasyon, yeni nesil ile değiştirilir.
             population = new_population
 
+        if population_out is not None:
+            population_out.extend(sorted(population, key=lambda x: x[1]))
+        if stats is not None:
+            stats.update(stop_reason=stop_reason, generations_run=generations_run)
+
         # Toplam geçen süre hesaplanır.
         elapsed = (time.time() - start_time) * 1000
         # En iyi çözüm ve süre döndürülür.
         return global_best_path, global_best_cost, elapsed
 
     @staticmethod
-    def _random_path(graph, source, target, min_bw):
-        """Kaynaktan hedefe rastgele geçerli bir yol oluşturur."""
-        path = [source]
-        visited = set([source])
-        curr = source
-        
-        while curr != target:
-            # Geçerli komşuları bul:
-            # 1. Ziyaret edilmemiş olmalı (path içinde olmamalı)
-            # 2. Bant genişliği gereksinimini karşılamalı
-            neighbors = [n for n in graph.neighbors(curr) 
-                         if n not in visited and graph[curr][n].get('bandwidth', 0) >= min_bw]
-            
-            # Eğer geçerli komşu yoksa (çıkmaz sokak):
-            if not neighbors: return None
-            
-            # Rastgele bir komşu seç.
-            next_node = random.choice(neighbors)
-            path.append(next_node)
-            visited.add(next_node)
-            curr = next_node
-            
-            # Çok uzun yolları engellemek için sınır.
-            if len(path) > 250: return None
-            
-        return path
+    def _evolve_steady_state(population, population_size, generations, walker, fitness, rng,
+                             stagnation_limit, time_budget_ms, start_time, best_history):
+        """
+        Kararlı durum evrimi: Her adımda tek çocuk üretilir. Popülasyon bir yığın (en kötü üstte)
+        ve yol imzası kümesinde tutulur; çocuk sadece yeniyse ve en kötüden iyiyse onun yerini alır.
+        Nesil başına tüm popülasyonu yeniden kurma ve sıralama (O(P log P)) yapılmaz.
+
+        Bütçe generations * population_size adımdır. Durdurma ölçütleri her population_size
+        adımda bir (bir nesle denk) kontrol edilir; popülasyon kopyasız olduğu için çeşitlilik
+        ölçütü kullanılmaz.
+
+        Returns:
+            tuple: (en iyi yol, en iyi maliyet, sıralı son popülasyon, durma nedeni, nesil sayısı)
+        """
+        pool = SteadyStatePopulation(population_size)
+        for path, cost in population:
+            pool.offer(path, cost)
+        if best_history is not None and pool.best_path is not None:
+            best_history.append((0, pool.best_cost))
+
+        stop_reason = "generations"
+        stale = 0   # İyileşme olmadan geçen adım sayısı
+        steps = 0
+        for steps in range(1, generations * population_size + 1):
+            if steps % population_size == 0:
+                if stagnation_limit is not None and stale >= stagnation_limit * population_size:
+                    stop_reason = "stagnation"
+                    break
+                if time_budget_ms is not None and (time.time() - start_time) * 1000 >= time_budget_ms:
+                    stop_reason = "time_budget"
+                    break
+
+            # Seçim -> Çaprazlama -> Mutasyon (nesilsel modla aynı operatörler)
+            child = GASolver._crossover(pool.tournament(rng), pool.tournament(rng), rng)
+            if rng.random() < 0.2:
+                child = GASolver._mutate(walker, child, rng)
+
+            previous = pool.best_cost
+            pool.offer(child, fitness(child))
+            if pool.best_cost < previous:
+                stale = 0
+                if best_history is not None:
+                    best_history.append((steps, pool.best_cost))
+            else:
+                stale += 1
+
+        return pool.best_path, pool.best_cost, pool.items(), stop_reason, steps // population_size
+
+    @staticmethod
+    def solve_islands(graph, source, target, weights, min_bw, population_size=40, generations=30,
+                      islands=ISLANDS, migration_interval=MIGRATION_INTERVAL, migrants=MIGRANTS, seed=None):
+        """
+        Ada modeli (island model) paralel GA: 'islands' ada ayrı süreçlerde evrimleşir ve her
+        'migration_interval' nesilde en iyi 'migrants' birey halka düzeninde komşu adaya göç eder.
+        Sabit (seed, islands) için sonuç tekrarlanabilir. Dönüş formatı solve() ile aynıdır.
+        """
+        start_time = time.time()
+        params = {"source": source, "target": target, "weights": tuple(weights), "min_bw": min_bw,
+                  "population_size": population_size}
+        path, cost = run_islands(graph, (os.path.abspath(__file__), "_ga_island_epoch"), params, generations,
+                                 islands=islands, migration_interval=migration_interval,
+                                 migrants=migrants, seed=seed)
+        return path, cost, (time.time() - start_time) * 1000
 
     @staticmethod
-    def _tournament_selection(population):
+    def _random_path(walker, source, rng):
+        """
+        Kaynaktan hedefe rastgele geçerli bir yol oluşturur.
+        Yürüyüş sadece bant genişliğine uygun ve hedefe ulaşabilen düğümlerden geçer;
+        çıkmaz sokakta geri çekilir. Bu yüzden kaynak hedefe ulaşabiliyorsa her zaman bir yol döner.
+        """
+        return walker.walk([source], rng)
+
+    @staticmethod
+    def _tournament_selection(population, rng):
         """Turnuva seçimi: Rastgele k birey seçilir, en iyisi döndürülür."""
         k = 3 # Turnuva boyutu
         # Popülasyondan rastgele k aday seç.
-        candidates = random.sample(population, k)
+        candidates = rng.sample(population, k)
         # Maliyeti en düşük (en iyi) olanı döndür.
         return min(candidates, key=lambda x: x[1])
 
     @staticmethod
-    def _crossover(parent1, parent2):
-        """İki ebeveyn yolu birleştirerek yeni bir yol (çocuk) oluşturur."""
-        # İki yol arasındaki ortak düğümleri bul (Başlangıç ve bitiş hariç).
-        # Ortak düğümler, yolları kesip birleştirebileceğimiz kavşak noktalarıdır.
-        common_nodes = list(set(parent1[1:-1]) & set(parent2[1:-1]))
-        
-        # Eğer ortak ara düğüm yoksa, crossover yapılamaz.
-        # Rastgele biri (parent1) olduğu gibi döndürülür.
-        if not common_nodes:
-            return parent1 
+    def _crossover(parent1, parent2, rng):
+        """
+        İki ebeveyn yolu birleştirerek yeni bir yol (çocuk) oluşturur.
+        Çocuk = parent1[:i] + parent2[j:], burada parent1[i] == parent2[j] ortak bir ara düğümdür.
+
+        - parent2 için düğüm -> pozisyon haritası bir kez kurulur; .index() araması yapılmaz.
+        - parent1 tek geçişte taranır: Her ortak düğüm bir kesim çiftidir (i, j). Prefix'teki
+          düğümlerin parent2'deki en büyük pozisyonu (m) taşınır; m < j ise çocuk döngüsüzdür.
+        - Döngüsüz kesim varsa aralarından rastgele biri seçilir. Yoksa rastgele bir kesim
+          seçilir ve oluşan döngüler reddedilmek yerine silinir (loop erasure).
+        Toplam maliyet O(L) (L: yol uzunluğu).
+        """
+        pos2 = {n: j for j, n in enumerate(parent2)}
+        last = len(parent2) - 1
+
+        cuts = []        # Tüm kesim çiftleri (i, j)
+        loop_free = []   # Döngü oluşturmayan kesim çiftleri
+        max_pos = -1     # parent1[:i] düğümlerinin parent2'deki en büyük pozisyonu
+        for i in range(1, len(parent1) - 1):
+            max_pos = max(max_pos, pos2.get(parent1[i - 1], -1))
+            j = pos2.get(parent1[i])
+            if j is None or j == 0 or j == last:
+                continue
+            cuts.append((i, j))
+            if max_pos < j:
+                loop_free.append((i, j))
+
+        # Ortak ara düğüm yoksa crossover yapılamaz; parent1 olduğu gibi döndürülür.
+        if not cuts:
+            return parent1
+
+        if loop_free:
+            i, j = rng.choice(loop_free)
+            return parent1[:i] + parent2[j:]
+
+        # Döngülü çocuk onarılır: Tekrar eden düğüme gelindiğinde aradaki döngü silinir.
+        i, j = rng.choice(cuts)
+        return GASolver._erase_loops(parent1[:i] + parent2[j:])
 
-        # Ortak düğümlerden rastgele bir kesim noktası seçilir.
-        cut_node = random.choice(common_nodes)
-        
-        # Kesim noktasının her iki ebeveyndeki indeksleri bulunur.
-        idx1 = parent1.index(cut_node)
-        idx2 = parent2.index(cut_node)
-        
-        # Parent1'in başı ile Parent2'nin sonu birleştirilir.
-        # Bu, genetik çeşitliliği sağlayan yeni bir rota oluşturur.
-        new_path = parent1[:idx1] + parent2[idx2:]
-        
-        # Geçerlilik Kontrolü:
-        # Oluşan yeni yolda tekrar eden düğüm var mı? (Döngü kontrolü)
-        if len(new_path) != len(set(new_path)):
-            return parent1 # Geçersizse ebeveyni döndür.
-            
-        return new_path
+    @staticmethod
+    def _erase_loops(path):
+        """Yoldaki döngüleri siler: Bir düğüme ikinci kez gelindiğinde aradaki kısım atılır. O(L)."""
+        result = []
+        position = {}
+        for node in path:
+            k = position.get(node)
+            if k is not None:
+                for n in result[k + 1:]:
+                    del position[n]
+                del result[k + 1:]
+            else:
+                position[node] = len(result)
+                result.append(node)
+        return result
 
     @staticmethod
-    def _mutate(graph, path, min_bw):
+    def _mutate(walker, path, rng):
         """Bir yolda rastgele değişiklik (mutasyon) yapar."""
         # Çok kısa yollarda mutasyon yapılamaz.
         if len(path) < 3: return path
         
         # Yol üzerinde rastgele bir kopma noktası seçilir.
-        idx = random.randint(1, len(path)-2)
+        idx = rng.randint(1, len(path)-2)
         # Mutasyon noktasına kadar olan kısım alınır.
         partial_path = path[:idx+1]
         
-        # Hedef düğüm alınır.
-        target = path[-1]
-        
         # Kopma noktasından itibaren hedefe giden YENİ rastgele bir yol aranır.
-        remaining = GASolver._random_path_from_partial(graph, partial_path, target, min_bw)
+        remaining = GASolver._random_path_from_partial(walker, partial_path, rng)
         
         # Eğer geçerli bir yol bulunursa döndürülür.
         if remaining:
@@ -554,27 +1065,21 @@ class GASolver:
         return path
 
     @staticmethod
-    def _random_path_from_partial(graph, current_path, target, min_bw):
-        """Kısmi bir yoldan başlayıp hedefe giden rastgele yol tamamlar."""
-        path = list(current_path)
-        visited = set(path)
-        curr = path[-1]
-        
-        while curr != target:
-            # Geçerli komşuları bul (Ziyaret edilmemiş ve BW yeterli).
-            neighbors = [n for n in graph.neighbors(curr) 
-                         if n not in visited and graph[curr][n].get('bandwidth', 0) >= min_bw]
-            
-            if not neighbors: return None
-            
-            next_node = random.choice(neighbors)
-            path.append(next_node)
-            visited.add(next_node)
-            curr = next_node
-            
-            if len(path) > 250: return None
-            
-        return path
+    def _random_path_from_partial(walker, current_path, rng):
+        """Kısmi bir yoldan başlayıp hedefe giden rastgele yol tamamlar (kısmi yol hedeften koparıyorsa None)."""
+        return walker.walk(current_path, rng)
+
+
+def _ga_island_epoch(graph, params, generations, rng, population, fitness_cache):
+    """GASolver ada modelinde bir adanın 'generations' nesillik dönemi (ada_modeli işçilerinde çalışır)."""
+    final = []
+    path, cost, _ = GASolver.solve(graph, generations=generations, rng=rng, fitness_cache=fitness_cache,
+                                   initial_population=[p for p, _ in population] if population else None,
+                                   population_out=final, **params)
+    # Son nesil henüz en iyi kontrolünden geçmedi; sıralı son popülasyonun başına bakılır
+    if final and final[0][1] < cost:
+        path, cost = final[0]
+    return path, cost, final
 
 # =================================================================================================
 # 4. ARAYÜZ (GUI) - PyQt6
@@ -688,7 +1193,9 @@ class MainWindow(QMainWindow):
         if "ACO" in algo_choice:
             path, cost, time_ms = ACOSolver.solve(self.G, S, D, weights, min_bw=B)
         else:
-            path, cost, time_ms = GASolver.solve(self.G, S, D, weights, min_bw=B)
+            path, cost, time_ms = GASolver.solve(self.G, S, D, weights, min_bw=B,
+                                                 stagnation_limit=GA_GUI_STAGNATION_LIMIT,
+                                                 min_diversity=GA_GUI_MIN_DIVERSITY)
 
         # Eğer başarılı bir yol bulunduysa:
         if path:
@@ -804,6 +1311,11 @@ class MainWindow(QMainWindow):
         
         weights = (0.33, 0.33, 0.34) # Sabit ağırlıklar
         repeats = 5  # Her senaryo için tekrar sayısı (İstatistiksel güvenilirlik için)
+        # ACO talepleri feromonları paylaşır: Sonraki talepler öncekilerin izinden başlar.
+        # Aynı talebin tekrarları ise hep talepten önceki izden başlar (bağımsız örnekler).
+        pheromone_store = PheromoneStore(ACO_PHEROMONE_DIR)
+        # Graf toplu test boyunca değişmez: Depo anahtarının sürümü bir kez hesaplanır
+        graph_version = topology_version(self.G)
 
         prog_val = 0
         # Tüm talepler üzerinde döngü
@@ -814,14 +1326,23 @@ class MainWindow(QMainWindow):
                 times = []
                 success_count = 0
                 
+                # Aynı talebin tekrarları tek bir fitness önbelleğini paylaşır
+                cache = FitnessCache()
+                # İlk tekrar depoyu günceller; diğerleri ilk tekrardan önceki anlık görüntüyle başlar
+                snapshot = (pheromone_store.snapshot(self.G, weights, B, version=graph_version)
+                            if algo_name == "ACO" else None)
                 # İstatistik toplamak için 'repeats' kadar çalıştır
-                for _ in range(repeats):
+                for r in range(repeats):
                     if algo_name == "ACO":
                         # Daha hızlı sonuç için iterasyon/karınca sayısı düşürüldü
-                        path, cost, t = ACOSolver.solve(self.G, S, D, weights, min_bw=B, num_ants=15, num_iterations=15)
+                        path, cost, t = ACOSolver.solve(self.G, S, D, weights, min_bw=B, num_ants=15, num_iterations=15,
+                                                        pheromone_store=pheromone_store if r == 0 else snapshot,
+                                                        graph_version=graph_version)
                     else:
                         # Daha hızlı sonuç için popülasyon/jenerasyon düşürüldü
-                        path, cost, t = GASolver.solve(self.G, S, D, weights, min_bw=B, population_size=20, generations=20)
+                        path, cost, t = GASolver.solve(self.G, S, D, weights, min_bw=B, population_size=20, generations=20,
+                                                        fitness_cache=cache, stagnation_limit=GA_GUI_STAGNATION_LIMIT,
+                                                        min_diversity=GA_GUI_MIN_DIVERSITY)
                     
                     if path:
                         success_count += 1
@@ -142,7 +142,7 @@ class Particle:
 class PSO:
     """Algoritma Yöneticisi"""
     def __init__(self, G, S, D, min_bw,
-                 num_particles=30, iterations=100, seed=None):
+                 num_particles=30, iterations=100, seed=None, rng=None):
         self.G = G
         self.S = S
         self.D = D
@@ -150,6 +150,8 @@ class PSO:
         self.num_particles = num_particles
         self.iterations = iterations
         self.seed = seed
+        # (Opsiyonel) Dışarıdan verilen random.Random örneği; yoksa her run() seed ile kendi üretecini kurar
+        self.rng = rng
 
         self.particles = []
         self.gbest = None
@@ -196,8 +198,8 @@ class PSO:
     # 3. Ana Döngü (Optimization Loop)
     # -----------------------------
     def run(self):
-        if self.seed is not None:
-            random.seed(self.seed)
+        # Çağrıya özel üreteç: global 'random' durumuna dokunulmaz (thread güvenli, tekrarlanabilir)
+        rng = self.rng if self.rng is not None else random.Random(self.seed)
         self.initialize()
 
         if not self.gbest:
@@ -214,7 +216,7 @@ class PSO:
                     continue
 
                 # Rastgele bir kesim noktası seç
-                cut = random.randint(1, len(self.gbest) - 2)
+                cut = rng.randint(1, len(self.gbest) - 2)
                 
                 # Yeni yol (Aday): Gbest'in başı + Mevcut yolun sonu
                 # Not: Bu çok basit bir kombinasyon, her zaman geçerli yol üretmeyebilir.
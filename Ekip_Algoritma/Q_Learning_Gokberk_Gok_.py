@@ -19,6 +19,8 @@
 
 import random
 import math
+import heapq
+import numpy as np
 import networkx as nx
 import pandas as pd
 import os
@@ -47,6 +49,14 @@ EPSILON = 0.2        # Keşif Oranı (Exploration Rate): Rastgele hareket etme o
 EPISODES = 300       # Bölüm Sayısı: Ajanın kaç kez baştan sona gidip geleceği.
 MAX_STEPS = 250      # Maksimum Adım: Bir bölümde sonsuz döngüye girmemek için limit.
 
+# Model Tabanlı Planlama (Dyna-Q / Prioritized Sweeping)
+PLANNING_STEPS = 0   # Her gerçek adımdan sonra yapılacak simüle güncelleme sayısı (0 = kapalı).
+PLANNING_THETA = 1e-3  # Öncelik eşiği: Bellman hatası bu değerin altındaysa kuyruğa alınmaz.
+PLANNING_MAX_PUSHES = 4  # Bir güncellemeden sonra kuyruğa alınan en fazla öncül (predecessor) sayısı.
+
+# Toplu (Batched) Eğitim
+NUM_AGENTS = 32      # Aynı anda (lockstep) yürütülen bağımsız ajan sayısı.
+
 # Maliyet Ağırlıkları (Kullanıcı Arayüzünden de gelebilir)
 W_DELAY = 0.4        # Gecikme ağırlığı
 W_RELIABILITY = 0.4  # Güvenilirlik ağırlığı
@@ -122,20 +132,45 @@ def total_cost(G, path, w_delay, w_rel, w_res):
             w_res   * path_resource_cost(G, path))
 
 
+def node_reliability_cost(G, n):
+    """Tek bir düğümün -log(güvenilirlik) maliyeti (path_reliability_cost ile aynı kural)."""
+    val = G.nodes[n]['node_rel']
+    return -math.log(val) if val > 0 else float('inf')
+
+
+def edge_cost_terms(G, u, v):
+    """
+    Tek bir kenarın (gecikme, güvenilirlik maliyeti, kaynak maliyeti) bileşenlerini döndürür.
+    Episode içinde maliyeti adım adım biriktirmek için kullanılır; böylece hedefe
+    varıldığında tüm yolu yeniden dolaşmaya gerek kalmaz.
+    """
+    e = G.edges[u, v]
+    rel = e['link_rel']
+    bw = e['bandwidth']
+    return (e['link_delay'],
+            -math.log(rel) if rel > 0 else float('inf'),
+            1000.0 / bw if bw > 0 else float('inf'))
+
+
 # =================================================================================================
 # Q-LEARNING AGENT SINIFI
 # =================================================================================================
 class QLearning:
-    def __init__(self, G, alpha, gamma, epsilon):
+    def __init__(self, G, alpha, gamma, epsilon, initial_q=None, rng=None):
         self.G = G
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
+        # Ajana özel rastgele sayı üreteci (global 'random' durumu paylaşılmaz;
+        # paralel thread'lerde çalışan çözücüler birbirinin dizisini bozmaz)
+        self.rng = rng if rng is not None else random.Random()
         
         # Q-Tablosunun Başlatılması
         # Her düğüm (state) için komşularına (action) giden kenarların değeri 0 ile başlar.
         # Yapı: {Düğüm_ID: {Komşu_1: 0.0, Komşu_2: 0.0, ...}}
-        self.Q = {n: {nb: 0.0 for nb in G.neighbors(n)} for n in G.nodes()}
+        # initial_q ({(s, a): değer}) verilirse önceki eğitimden kalan değerlerle başlar (warm start).
+        initial_q = initial_q or {}
+        self.Q = {n: {nb: initial_q.get((n, nb), 0.0) for nb in G.neighbors(n)} for n in G.nodes()}
 
     def choose(self, s):
         """
@@ -148,14 +183,28 @@ class QLearning:
             return None # Çıkmaz sokak
         
         # Rastgele keşif (Exploration)
-        if random.random() < self.epsilon:
-            return random.choice(neighbors)
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(neighbors)
             
         # En iyi bilinen yolu seç (Exploitation)
         max_q = max(self.Q[s].values())
         # Birden fazla en iyi varsa, aralarından rastgele seç
         best = [a for a, q in self.Q[s].items() if q == max_q]
-        return random.choice(best)
+        return self.rng.choice(best)
+
+    def bellman_error(self, s, a, r, s_next):
+        """
+        Bir (s, a) çifti için Bellman hatasını (TD error) döndürür.
+        Hata = Reward + gamma * max(Q(s',all)) - Q(s,a)
+        """
+        max_next = 0
+        
+        # Bir sonraki adımdaki en iyi Q değerini bul (Gelecek tahmini)
+        if s_next is not None and s_next in self.Q and len(self.Q[s_next]) > 0:
+            max_next = max(self.Q[s_next].values())
+            
+        # Hedeflenen yeni değer (Target) ile mevcut değerin farkı
+        return r + self.gamma * max_next - self.Q[s][a]
 
     def update(self, s, a, r, s_next):
         """
@@ -168,17 +217,100 @@ class QLearning:
             r (float): Alınan ödül (Reward)
             s_next (int): Bir sonraki durum (Next State). Hedefe varıldıysa None olabilir.
         """
-        max_next = 0
-        
-        # Bir sonraki adımdaki en iyi Q değerini bul (Gelecek tahmini)
-        if s_next is not None and s_next in self.Q and len(self.Q[s_next]) > 0:
-            max_next = max(self.Q[s_next].values())
-            
-        # Hedeflenen yeni değer (Target)
-        td = r + self.gamma * max_next
-        
         # Mevcut değeri güncelle
-        self.Q[s][a] += self.alpha * (td - self.Q[s][a])
+        self.Q[s][a] += self.alpha * self.bellman_error(s, a, r, s_next)
+
+
+# =================================================================================================
+# MODEL TABANLI PLANLAMA (PRIORITIZED SWEEPING)
+# =================================================================================================
+class PrioritizedSweeping:
+    """
+    Dyna-Q ailesinden Prioritized Sweeping planlayıcısı.
+    
+    Ağdaki geçiş modeli tamamen bilinir: 's' düğümünden 'a' komşusuna gitmek
+    ajanı deterministik olarak 'a' düğümüne götürür ve ara adımların ödülü sabittir (-1).
+    Hedefe varış ödülü tüm yolun maliyetine bağlıdır; ajan hedefin bir komşusu s'ye gerçek
+    bir yolla geldiğinde, o yolun s'den hedefe varış ödülü bilinen son kenar maliyetiyle tam
+    hesaplanır (observe_terminal). Model her s için ulaşılabilir en iyi ödülü saklar.
+    
+    Gerçek güncellemeler ajanın kendisinde (agent.update) yapılır; planlayıcı sadece kuyruğu
+    besler. Bir Q(s, ·) satırının en büyük değeri değiştiğinde s'ye gelen komşulardan Bellman
+    hatası en büyük 'max_pushes' tanesi öncelik kuyruğuna (heap) alınır; her gerçek adımdan
+    sonra en öncelikli N çift simüle edilir. Böylece hedefe yakın iyi düğümlerin değeri,
+    ajanın oraya tekrar tekrar yürümesini beklemeden kaynağa doğru yayılır.
+    """
+    def __init__(self, agent, destination, theta=PLANNING_THETA, step_reward=-1, max_pushes=PLANNING_MAX_PUSHES):
+        self.agent = agent
+        self.destination = destination
+        self.theta = theta
+        self.step_reward = step_reward
+        self.max_pushes = max_pushes
+        
+        # Öncelik kuyruğu: (-öncelik, sıra_no, s, a). Sıra numarası eşitlikleri deterministik çözer.
+        self.queue = []
+        self.counter = 0
+        # Her satırın en son kuyruğa yansıtılmış en büyük değeri (değişmediyse komşular taranmaz)
+        self.last_max = {}
+        # Hedefe varış modeli: {s: ödül}. s'ye gerçek bir ön yolla (prefix) gelindiğinde, bilinen
+        # son kenar maliyetiyle o yolun hedefe varış ödülü tam hesaplanır; en iyisi saklanır.
+        self.terminal_rewards = {}
+
+        # Toplam simüle güncelleme sayısı (raporlama için)
+        self.backups = 0
+
+    def push_predecessors(self, s):
+        """
+        Q(s, ·) satırının en büyük değeri değiştiyse s'ye tek adımda ulaşan (s_prev, s) çiftlerinden
+        Bellman hatası en büyük 'max_pushes' tanesini kuyruğa ekler. max(Q(s, ·)) bir kez hesaplanır.
+        """
+        Q = self.agent.Q
+        if s == self.destination or not Q[s]:
+            return
+        max_next = max(Q[s].values())
+        if self.last_max.get(s) == max_next:
+            return
+        self.last_max[s] = max_next
+
+        target = self.step_reward + self.agent.gamma * max_next
+        candidates = [(abs(target - Q[s_prev][s]), s_prev) for s_prev in self.agent.G.neighbors(s)
+                      if s_prev != self.destination]
+        for priority, s_prev in heapq.nlargest(self.max_pushes, candidates):
+            if priority <= self.theta:
+                break
+            heapq.heappush(self.queue, (-priority, self.counter, s_prev, s))
+            self.counter += 1
+
+    def observe(self, s):
+        """Gerçek bir güncellemeden sonra çağrılır: Q(s, ·) değiştiği için s'nin öncülleri kuyruğa alınır."""
+        self.push_predecessors(s)
+
+    def observe_terminal(self, s, reward):
+        """
+        Ajan s'ye (hedefin komşusu) gerçek bir yolla geldiğinde, o yolun hedefe varış ödülü modele yazılır.
+        Ödül daha öncekinden iyiyse (s, hedef) çifti kuyruğa alınır.
+        """
+        if reward <= self.terminal_rewards.get(s, float("-inf")):
+            return
+        self.terminal_rewards[s] = reward
+        priority = abs(reward - self.agent.Q[s][self.destination])
+        if priority > self.theta:
+            heapq.heappush(self.queue, (-priority, self.counter, s, self.destination))
+            self.counter += 1
+
+    def plan(self, n):
+        """Kuyruktan en yüksek öncelikli en fazla n (s, a) çiftini model üzerinden günceller."""
+        for _ in range(n):
+            if not self.queue:
+                break
+            _, _, s, a = heapq.heappop(self.queue)
+            # Model deterministik olduğu için tam (alpha=1) yedekleme yapılır.
+            if a == self.destination:
+                self.agent.Q[s][a] = self.terminal_rewards[s]
+            else:
+                self.agent.Q[s][a] += self.agent.bellman_error(s, a, self.step_reward, a)
+            self.backups += 1
+            self.push_predecessors(s)
 
 
 # =================================================================================================
@@ -257,9 +389,9 @@ def generate_graph(N, p):
 # =================================================================================================
 # Q-LEARNING EĞİTİM LOOP (Training Loop)
 # =================================================================================================
-def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, max_steps, w_delay, w_rel, w_res, seed=None):
-    if seed is not None:
-        random.seed(seed)
+def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, max_steps, w_delay, w_rel, w_res, seed=None,
+                     planning_steps=PLANNING_STEPS, planning_theta=PLANNING_THETA,
+                     planning_max_pushes=PLANNING_MAX_PUSHES, q_store=None, rng=None):
     """
     Q-Learning ajanını eğiterek en iyi rotayı bulmasını sağlar.
     
@@ -268,12 +400,28 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
     2. Hedefe varana kadar veya max adıma kadar yürü.
     3. Her adımda Q tablosunu güncelle.
     4. Hedefe varınca büyük bir ödül ver ve en iyi yolu kaydet.
+       Yol maliyeti adım adım biriktirilir; hedefte maliyet O(1) ile okunur.
+       Ajan yoldaki bir düğüme geri dönerse aradaki döngü yoldan silinir (loop erasure),
+       böylece döngüler ne maliyeti ne de yol uzunluğunu şişirir.
+    5. (Opsiyonel) planning_steps > 0 ise her gerçek adımdan sonra bilinen topoloji modeli
+       üzerinden Prioritized Sweeping ile N adet simüle güncelleme yap. Bir güncellemeden sonra
+       en fazla planning_max_pushes öncül kuyruğa alınır.
+    6. (Opsiyonel) q_store (q_tablosu.QTableStore) verilirse Q-tablosu kayıtlı tablodan
+       başlatılır (topoloji değiştiyse kenar ID'leriyle eşlenir) ve eğitim sonunda kaydedilir.
+       Küçük ağ değişikliklerinden sonra birkaç düzine episode ile ince ayar yeterlidir.
+    
+    Rastgelelik çağrıya özel bir random.Random (rng verilmezse seed ile oluşturulur)
+    üzerinden gelir; global 'random' modülü kullanılmaz, eşzamanlı çağrılar güvenlidir.
     """
+    if rng is None:
+        rng = random.Random(seed)
     
     print(f"\n🎓 EĞİTİM PARAMETRELERİ:")
     print(f"  Kaynak->Hedef: {source} -> {destination}")
     print(f"  Hiperparametreler: Alpha={alpha}, Gamma={gamma}, Epsilon={epsilon}")
     print(f"  Ağırlıklar: Delay={w_delay}, Rel={w_rel}, Res={w_res}")
+    if planning_steps > 0:
+        print(f"  Planlama: Prioritized Sweeping, {planning_steps} simüle güncelleme/adım")
 
     # Ağırlık Normalizasyonu
     total_w = w_delay + w_rel + w_res
@@ -282,8 +430,14 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
         w_rel /= total_w
         w_res /= total_w
 
-    # Ajanı (Agent) Başlat
-    agent = QLearning(G, alpha, gamma, epsilon)
+    # Ajanı (Agent) Başlat (kayıtlı tablo varsa sıcak başlangıç)
+    weights = (w_delay, w_rel, w_res)
+    initial_q = q_store.warm_start(G, destination, weights) if q_store else None
+    agent = QLearning(G, alpha, gamma, epsilon, initial_q, rng=rng)
+
+    # Model tabanlı planlayıcı (kapalıysa None)
+    planner = (PrioritizedSweeping(agent, destination, planning_theta, max_pushes=planning_max_pushes)
+               if planning_steps > 0 else None)
 
     best_path = None
     best_cost = float("inf")
@@ -291,7 +445,12 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
     # --- EPISODE DÖNGÜSÜ ---
     for ep in range(episodes):
         s = source
-        path = [s] # Mevcut epizodun izlediği yol
+        path = [s] # Mevcut epizodun izlediği yol (döngüsüz)
+
+        # Artımlı maliyet: path[i]'ye kadar biriken (gecikme, güvenilirlik, kaynak) değerleri
+        prefix = [(0.0, node_reliability_cost(G, s), 0.0)]
+        # Ziyaret edilen düğümlerin yoldaki pozisyonu (döngü tespiti için)
+        position = {s: 0}
 
         # --- STEP DÖNGÜSÜ ---
         for step in range(max_steps):
@@ -302,13 +461,20 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
             if a is None:
                 break
 
-            path.append(a)
+            # Bu adımın maliyetini önceki toplamlara ekle
+            delay, rel, res = prefix[-1]
+            d_edge, r_edge, res_edge = edge_cost_terms(G, s, a)
+            delay += d_edge
+            rel += r_edge + node_reliability_cost(G, a)
+            res += res_edge
 
             # 2. Hedef Kontrolü ve Ödül
             # Eğer hedefe ulaştıysak;
             if a == destination:
-                # Yolun toplam maliyetini hesapla
-                cost = total_cost(G, path, w_delay, w_rel, w_res)
+                path.append(a)
+
+                # Yolun toplam maliyeti (biriktirilmiş değerlerden, O(1))
+                cost = w_delay * delay + w_rel * rel + w_res * res
                 
                 # Ödül fonksiyonu: Maliyet ne kadar düşükse ödül o kadar büyük olmalı.
                 # Örnek: Cost 10 ise Reward 1000, Cost 100 ise Reward 100.
@@ -319,6 +485,11 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
                 
                 # Q Değerini güncelle (s -> a hamlesi mükemmeldi!)
                 agent.update(s, a, reward, None) # Next state None çünkü bitti
+                # Planlama açıksa yeni değer öncüller üzerinden kaynağa doğru yayılır.
+                if planner:
+                    planner.observe_terminal(s, reward)
+                    planner.observe(s)
+                    planner.plan(planning_steps)
 
                 # Global En İyiyi Güncelle
                 if cost < best_cost:
@@ -332,6 +503,33 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
             # Ceza (-1) vererek ajanı kısa yolları bulmaya teşvik ediyoruz (daha az adım = daha az ceza).
             # VEYA maliyete dayalı anlık ceza verilebilir.
             agent.update(s, a, -1, a)
+
+            # Yolu güncelle: Düğüm zaten yoldaysa aradaki döngüyü sil (loop erasure)
+            if a in position:
+                k = position[a]
+                for n in path[k + 1:]:
+                    del position[n]
+                del path[k + 1:]
+                del prefix[k + 1:]
+            else:
+                # Ara düğümün işlem gecikmesi (hedef hariç)
+                delay += G.nodes[a]['proc_delay']
+                position[a] = len(path)
+                path.append(a)
+                prefix.append((delay, rel, res))
+
+            # Planlama: a hedefin komşusuysa, bu (döngüsüz) yolun a'dan hedefe varış ödülü
+            # bilinen kenar maliyetiyle tam hesaplanır ve modele yazılır; sonra N simüle güncelleme.
+            if planner:
+                if destination in agent.Q[a]:
+                    d_last, r_last, res_last = prefix[-1]
+                    d_edge, r_edge, res_edge = edge_cost_terms(G, a, destination)
+                    finish = (w_delay * (d_last + d_edge)
+                              + w_rel * (r_last + r_edge + node_reliability_cost(G, destination))
+                              + w_res * (res_last + res_edge))
+                    planner.observe_terminal(a, 10000 / finish if finish > 0 else 10000)
+                planner.observe(s)
+                planner.plan(planning_steps)
             
             # Konumu güncelle
             s = a
@@ -340,6 +538,237 @@ def train_q_learning(G, source, destination, alpha, gamma, epsilon, episodes, ma
         if (ep + 1) % 100 == 0:
             print(f"📊 Episode {ep + 1}/{episodes} tamamlandı... (Şu ana kadarki en iyi maliyet: {best_cost:.2f})")
 
+    if planner:
+        print(f"🧠 Planlama: {planner.backups} simüle güncelleme yapıldı.")
+    if q_store:
+        q_store.save(G, agent.Q, destination, weights)
+    print(f"✅ Eğitim tamamlandı!\n")
+    return best_path, best_cost
+
+
+# =================================================================================================
+# TOPLU (BATCHED) EĞİTİM – NUMPY İLE LOCKSTEP ÇOKLU AJAN
+# =================================================================================================
+def build_topology_arrays(G):
+    """
+    Grafı NumPy dizilerine dönüştürür (dolgulu / padded komşuluk matrisi).
+    
+    Satır i, i. düğümün komşularını G.neighbors() sırasıyla tutar; eksik hücreler -1'dir.
+    Kenar maliyet bileşenleri (gecikme, -log güvenilirlik, 1000/BW) aynı hücrelerde saklanır,
+    böylece bir adımın maliyeti tek bir indeksleme işlemiyle okunur.
+    
+    Returns:
+        dict: nodes, index, nbr, deg, link_delay, link_rel_cost, res_cost, proc_delay, node_rel_cost
+    """
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    deg = np.array([G.degree(n) for n in nodes], dtype=np.int64)
+    width = max(int(deg.max()), 1) if len(nodes) else 1
+
+    nbr = np.full((len(nodes), width), -1, dtype=np.int64)
+    link_delay = np.zeros((len(nodes), width))
+    link_rel = np.ones((len(nodes), width))
+    bandwidth = np.ones((len(nodes), width))
+
+    for i, n in enumerate(nodes):
+        for j, m in enumerate(G.neighbors(n)):
+            e = G.edges[n, m]
+            nbr[i, j] = index[m]
+            link_delay[i, j] = e['link_delay']
+            link_rel[i, j] = e['link_rel']
+            bandwidth[i, j] = e['bandwidth']
+
+    proc_delay = np.array([G.nodes[n]['proc_delay'] for n in nodes], dtype=float)
+    node_rel = np.array([G.nodes[n]['node_rel'] for n in nodes], dtype=float)
+
+    # path_reliability_cost / path_resource_cost ile aynı kurallar: değer <= 0 ise maliyet sonsuz.
+    with np.errstate(divide='ignore'):
+        link_rel_cost = np.where(link_rel > 0, -np.log(np.where(link_rel > 0, link_rel, 1.0)), np.inf)
+        node_rel_cost = np.where(node_rel > 0, -np.log(np.where(node_rel > 0, node_rel, 1.0)), np.inf)
+        res_cost = np.where(bandwidth > 0, 1000.0 / np.where(bandwidth > 0, bandwidth, 1.0), np.inf)
+
+    return {
+        'nodes': nodes,
+        'index': index,
+        'nbr': nbr,
+        'deg': deg,
+        'link_delay': link_delay,
+        'link_rel_cost': link_rel_cost,
+        'res_cost': res_cost,
+        'proc_delay': proc_delay,
+        'node_rel_cost': node_rel_cost,
+    }
+
+
+def train_q_learning_batched(G, source, destination, alpha, gamma, epsilon, episodes, max_steps,
+                             w_delay, w_rel, w_res, seed=None, num_agents=NUM_AGENTS, rng=None):
+    """
+    train_q_learning ile aynı ödül yapısını kullanan, toplu (batched) eğitim motoru.
+    
+    Episode'lar tek tek yürütülmek yerine 'num_agents' adet bağımsız ajan aynı anda
+    (lockstep) ilerletilir. Komşu seçimi (epsilon-greedy), ödül hesabı ve Q güncellemesi
+    tüm ajanlar için NumPy dizi işlemleriyle yapılır:
+    
+    - Q tablosu (düğüm x komşu) biçiminde bir dizidir; geçersiz hücreler -inf'tir.
+    - Eşit Q değerleri ve keşif seçimi, rastgele anahtarların argmax'ı ile çözülür.
+    - Yol maliyeti her adımda biriktirilir (gecikme, güvenilirlik, kaynak), terminalde O(1).
+    - Ajan yoldaki bir düğüme geri dönerse aradaki döngü silinir (loop erasure, train_q_learning
+      ile aynı): Kaydedilen yollar ve maliyetler döngüsüzdür.
+    - Aynı adımda aynı (s, a) çiftini güncelleyen ajanların hedefleri ortalanır;
+      böylece çakışan güncellemeler ajan sırasından bağımsız ve deterministiktir.
+    
+    rng: (Opsiyonel) NumPy Generator. Verilmezse seed ile çağrıya özel bir Generator oluşturulur.
+    
+    Returns:
+        tuple: (best_path, best_cost) – train_q_learning ile aynı format.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    print(f"\n🎓 TOPLU EĞİTİM PARAMETRELERİ:")
+    print(f"  Kaynak->Hedef: {source} -> {destination}")
+    print(f"  Hiperparametreler: Alpha={alpha}, Gamma={gamma}, Epsilon={epsilon}")
+    print(f"  Ağırlıklar: Delay={w_delay}, Rel={w_rel}, Res={w_res}")
+    print(f"  Ajan Sayısı: {num_agents}")
+
+    # Ağırlık Normalizasyonu
+    total_w = w_delay + w_rel + w_res
+    if total_w > 0:
+        w_delay /= total_w
+        w_rel /= total_w
+        w_res /= total_w
+
+    T = build_topology_arrays(G)
+    nodes, nbr, deg = T['nodes'], T['nbr'], T['deg']
+    width = nbr.shape[1]
+    valid = nbr >= 0
+
+    # Q-Tablosu: Geçerli kenarlar 0.0, dolgu hücreleri -inf (max/argmax'a hiç girmez).
+    Q = np.where(valid, 0.0, -np.inf)
+    Q_flat = Q.reshape(-1)
+
+    src = T['index'][source]
+    dst = T['index'][destination]
+
+    best_path = None
+    best_cost = float("inf")
+
+    m = max(1, min(num_agents, episodes))
+    started = 0     # Başlatılan episode sayısı
+    finished = 0    # Biten episode sayısı
+
+    # Ajan durumları. Biten ajan, bütçe kaldıkça kaynaktan yeni bir episode'a başlatılır;
+    # böylece batch, en yavaş ajanı beklemeden sürekli dolu kalır.
+    state = np.full(m, src, dtype=np.int64)
+    steps = np.zeros(m, dtype=np.int64)
+    active = np.zeros(m, dtype=bool)
+
+    # Döngüsüz yol: paths[i, :plen[i] + 1]; position[i, n] düğümün yoldaki pozisyonu (-1 = yolda değil)
+    paths = np.full((m, max_steps + 1), -1, dtype=np.int64)
+    plen = np.zeros(m, dtype=np.int64)
+    position = np.full((m, len(nodes)), -1, dtype=np.int64)
+
+    # Artımlı maliyet: Yolun her pozisyonuna kadar biriken değerler (total_cost ile aynı bileşenler)
+    delay = np.zeros((m, max_steps + 1))
+    rel = np.zeros((m, max_steps + 1))
+    res = np.zeros((m, max_steps + 1))
+
+    def restart(agents):
+        """Verilen ajanları kaynak düğümde yeni bir episode'a başlatır."""
+        nonlocal started
+        agents = agents[:max(0, episodes - started)]
+        started += agents.size
+        state[agents] = src
+        steps[agents] = 0
+        paths[agents, 0] = src
+        plen[agents] = 0
+        position[agents] = -1
+        position[agents, src] = 0
+        delay[agents, 0] = 0.0
+        rel[agents, 0] = T['node_rel_cost'][src]
+        res[agents, 0] = 0.0
+        # Kaynağın hiç komşusu yoksa episode başlar başlamaz biter (train_q_learning ile aynı).
+        active[agents] = deg[src] > 0
+        return agents.size - np.count_nonzero(active[agents])
+
+    finished += restart(np.arange(m))
+
+    # --- LOCKSTEP DÖNGÜSÜ (tüm aktif ajanlar için aynı anda bir adım) ---
+    while True:
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+
+        s = state[idx]
+        q = Q[s]
+        keys = rng.random(q.shape)
+
+        # 1. Aksiyon Seç (Epsilon-Greedy, vektörel)
+        explore = rng.random(idx.size) < epsilon
+        greedy = q == q.max(axis=1, keepdims=True)
+        candidates = np.where(explore[:, None], valid[s], greedy)
+        col = np.argmax(np.where(candidates, keys, -1.0), axis=1)
+        a = nbr[s, col]
+
+        # 2. Maliyetleri Biriktir (döngüsüz yolun sonundaki değerlere bu adım eklenir)
+        arrived = a == dst
+        last = plen[idx]
+        d_new = delay[idx, last] + T['link_delay'][s, col] + np.where(arrived, 0.0, T['proc_delay'][a])
+        r_new = rel[idx, last] + T['link_rel_cost'][s, col] + T['node_rel_cost'][a]
+        q_new = res[idx, last] + T['res_cost'][s, col]
+        steps[idx] += 1
+
+        # 3. Ödül: Hedefte 10000/cost, ara adımlarda -1
+        cost = w_delay * d_new + w_rel * r_new + w_res * q_new
+        with np.errstate(divide='ignore'):
+            reward = np.where(arrived, np.where(cost > 0, 10000 / cost, 10000), -1.0)
+
+        # 4. Hedef (Target): r + gamma * max(Q(s', ·)); terminal veya çıkmaz sokakta gelecek 0.
+        terminal = arrived | (deg[a] == 0)
+        next_max = np.where(terminal, 0.0, Q[a].max(axis=1))
+        target = reward + gamma * next_max
+
+        # 5. Çakışma Çözümü ve Güncelleme: Aynı (s, a) hücresine düşen hedeflerin ortalaması alınır.
+        cells, inverse = np.unique(s * width + col, return_inverse=True)
+        mean_target = np.bincount(inverse, weights=target) / np.bincount(inverse)
+        Q_flat[cells] += alpha * (mean_target - Q_flat[cells])
+
+        # 6. Yolu Güncelle: Düğüm zaten yoldaysa aradaki döngü silinir (loop erasure);
+        #    hedef ve yeni düğümler yola eklenir.
+        k = position[idx, a]
+        loop = (k >= 0) & ~arrived
+        for i in np.flatnonzero(loop):
+            position[idx[i], paths[idx[i], k[i] + 1:last[i] + 1]] = -1
+        plen[idx[loop]] = k[loop]
+        grow = ~loop
+        g, g_pos = idx[grow], last[grow] + 1
+        plen[g] = g_pos
+        paths[g, g_pos] = a[grow]
+        position[g, a[grow]] = g_pos
+        delay[g, g_pos] = d_new[grow]
+        rel[g, g_pos] = r_new[grow]
+        res[g, g_pos] = q_new[grow]
+
+        # 7. Global En İyiyi Güncelle
+        if arrived.any():
+            hits = np.flatnonzero(arrived)
+            j = hits[np.argmin(cost[hits])]
+            if cost[j] < best_cost:
+                best_cost = float(cost[j])
+                best_path = [nodes[k] for k in paths[idx[j], :plen[idx[j]] + 1]]
+
+        # 8. Konumu Güncelle; hedefe varan, çıkmaza giren veya adım limitini dolduran ajan biter.
+        state[idx] = a
+        ended = idx[terminal | (steps[idx] >= max_steps)]
+        active[ended] = False
+
+        if ended.size:
+            before = finished
+            finished += ended.size
+            finished += restart(ended)
+            if finished // 100 > before // 100:
+                print(f"📊 Episode {finished}/{episodes} tamamlandı... (Şu ana kadarki en iyi maliyet: {best_cost:.2f})")
+
     print(f"✅ Eğitim tamamlandı!\n")
     return best_path, best_cost
 
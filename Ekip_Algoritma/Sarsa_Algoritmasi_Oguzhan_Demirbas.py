@@ -19,7 +19,10 @@ import math
 import time
 import csv
 import os
-from collections import defaultdict
+import numpy as np
+from array import array
+
+from ada_modeli import file_worker_pool, run_file_task
 
 # =================================================================================================
 # GLOBAL AYARLAR VE DOSYA YOLLARI
@@ -35,6 +38,23 @@ W_DELAY = 0.33
 W_RELIABILITY = 0.33
 W_RESOURCE = 0.34
 
+# SARSA(λ) – Uygunluk İzleri (Eligibility Traces)
+LAMBDA = 0.0          # 0 = klasik tek adımlı SARSA, 0 < λ <= 1 = SARSA(λ)
+TRACE_CUTOFF = 1e-3   # Bu değerin altına düşen izler silinir (seyrek iz tablosu)
+
+# Episode Sınırları (Öngörülebilir Çalışma Süresi)
+MAX_EPISODE_STEPS = 500  # Bir episode'daki en fazla adım (sonsuz dolaşmayı keser)
+STEP_BUDGET = None       # Tek bir sarsa_route çağrısının toplam adım bütçesi (None = sınırsız)
+CYCLE_PENALTY = 0.0      # Daha önce ziyaret edilen düğüme dönen adıma eklenen ek ceza
+
+# Q-Tablosu Depolama Tipi: "float32" (varsayılan) veya çok büyük graflar için "float16"
+Q_DTYPE = "float32"
+
+# Paralel Eğitim (Episode İşçileri)
+WORKERS = 1          # 1 = tek süreç; K > 1 = episode'lar K süreçte paralel çalışır
+MERGE_EVERY = 100    # İşçi başına kaç episode'da bir Q kopyalarının birleştirileceği
+MERGE_MODE = "mean"  # "mean" (ortalama) veya "max" (eleman bazında maksimum)
+
 # =================================================================================================
 # GRAF OLUŞTURMA (CSV -> NetworkX)
 # =================================================================================================
@@ -125,62 +145,176 @@ def compute_cost(G, path):
     )
 
 # =================================================================================================
-# SARSA ALGORİTMASI (CORE)
+# ÖN HESAPLAMA: GEÇERLİ KOMŞULAR VE KENAR MALİYETLERİ (CSR DİZİLERİ)
 # =================================================================================================
-def sarsa_route(G, S, D, min_bw, episodes=2000, seed=None):
+def build_feasible_arrays(G, min_bw, weights):
     """
-    SARSA algoritması ile Kaynak(S) -> Hedef(D) arasında yol bulur.
-    min_bw: Sadece bant genişliği bu değerden yüksek olan kenarlar kullanılır.
-    seed: Tekrarlanabilirlik için rastgele sayı üreteci başlangıç değeri.
+    Bant genişliği şartını sağlayan komşuları ve kenar maliyetlerini düz (flat) dizilere çıkarır.
+    
+    CSR (Compressed Sparse Row) düzeni:
+    - indptr[i] : i. düğümün komşularının 'nbr' içindeki başlangıç pozisyonu
+    - nbr[p]    : p pozisyonundaki kenarın gittiği düğümün indeksi
+    - cost[p]   : p pozisyonundaki kenarın ağırlıklı maliyeti (adım cezası için)
+    
+    i. düğümün geçerli komşuları nbr[indptr[i]:indptr[i+1]] aralığındadır ve G.neighbors()
+    sırasını korur. Böylece episode döngüsünde her adımda komşu listesi ve kenar maliyeti
+    yeniden hesaplanmaz; sadece dizi okunur. Diziler 'array' modülüyle kompakt tutulur
+    (eleman başına 8 bayt) ve indekslendiğinde doğrudan Python sayısı döner.
+    
+    Args:
+        G: NetworkX grafı
+        min_bw: Minimum bant genişliği
+        weights: (w_delay, w_reliability, w_resource)
+    
+    Returns:
+        dict: nodes, index, indptr, nbr, cost
     """
-    if seed is not None:
-        random.seed(seed)
+    w_delay, w_rel, w_res = weights
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+
+    indptr = array("q", [0])
+    nbr = array("q")
+    cost = array("d")
+    for u in nodes:
+        for v in G.neighbors(u):
+            edge = G[u][v]
+            if edge.get("bandwidth", 0) < min_bw:
+                continue
+
+            # Kenar maliyet bileşenleri (compute_cost ile aynı kurallar)
+            d_val = edge.get("link_delay", edge.get("delay", 0))
+            r_val = -math.log(max(edge.get("link_rel", edge.get("reliability", 0.99)), 1e-12))
+            b_val = 1000.0 / max(edge.get("bandwidth", 1), 1e-6)
 
-    # Q-Tablosu: Varsayılan değeri 0.0 olan bir sözlük.
-    # Anahtar (Key): (state, action) -> (mevcut_düğüm, gidilecek_komşu)
-    Q = defaultdict(float)
-    
-    # Hiperparametreler
-    alpha = 0.1     # Öğrenme hızı
-    gamma = 0.95    # İndirim faktörü
-    epsilon = 0.3   # Keşif oranı
+            nbr.append(index[v])
+            cost.append(w_delay * d_val + w_rel * r_val + w_res * b_val)
+        indptr.append(len(nbr))
+
+    return {"nodes": nodes, "index": index, "indptr": indptr, "nbr": nbr, "cost": cost}
+
+# =================================================================================================
+# SARSA ALGORİTMASI (CORE)
+# =================================================================================================
+def run_sarsa_episodes(G, F, Q, S, D, episodes, rng, alpha, gamma, epsilon,
+                       lam=LAMBDA, trace_cutoff=TRACE_CUTOFF,
+                       max_episode_steps=MAX_EPISODE_STEPS, step_budget=STEP_BUDGET,
+                       cycle_penalty=CYCLE_PENALTY, expected=False):
+    """
+    Verilen Q dizisi üzerinde (yerinde güncelleyerek) en fazla 'episodes' kadar SARSA episode'u çalıştırır.
+    Tek süreçli eğitim ve paralel işçiler (worker) aynı döngüyü kullanır.
+
+    Args:
+        G: NetworkX grafı (yol maliyeti için)
+        F: build_feasible_arrays() çıktısı
+        Q: CSR pozisyonuyla indekslenen Q dizisi
+        rng: random() ve randrange() sağlayan rastgele sayı üreteci
+        step_budget: Bu çağrının toplam adım bütçesi (None = sınırsız)
+
+    Returns:
+        tuple: (en iyi yol, en iyi maliyet, atılan toplam adım sayısı)
+    """
+    nodes, index = F["nodes"], F["index"]
+    indptr, nbr, edge_cost = F["indptr"], F["nbr"], F["cost"]
 
     best_path = None
     best_cost = float("inf")
 
-    # --- Yardımcı: Geçerli Komşuları Bul ---
-    def neighbors(u):
-        """Düğümün bant genişliği şartını sağlayan komşularını döndürür."""
-        return [
-            v for v in G.neighbors(u)
-            if G[u][v].get("bandwidth", 0) >= min_bw
-        ]
+    if S not in index:
+        raise nx.NetworkXError(f"The node {S} is not in the graph.")
+    source = index[S]
+    target = index.get(D, -1)
+
+    # --- Yardımcı: Epsilon-Greedy Seçim (CSR pozisyonu üzerinden) ---
+    def choose(u):
+        """u düğümünün geçerli komşularından birini seçer, seçilen kenarın CSR pozisyonunu döndürür."""
+        lo, hi = indptr[u], indptr[u + 1]
+        if rng.random() < epsilon:
+            return rng.randrange(lo, hi)
+        # En yüksek Q değerli komşu (eşitlikte ilk sıradaki)
+        return lo + int(Q[lo:hi].argmax())
+
+    # --- Yardımcı: Epsilon-Greedy Politikanın Beklenen Q Değeri (Expected SARSA) ---
+    def expected_q(u):
+        """
+        E[Q(u, ·)] = epsilon * ortalama(Q) + (1 - epsilon) * max(Q)
+        Açgözlü seçim tek bir (ilk) en iyi komşuyu seçtiği için beklenti, komşu dilimi
+        üzerinde vektörel bir ortalama ve maksimum indirgemesiyle hesaplanır.
+        """
+        values = Q[indptr[u]:indptr[u + 1]]
+        return epsilon * float(values.mean()) + (1 - epsilon) * float(values.max())
+
+    # --- Yardımcı: TD Güncellemesi (opsiyonel uygunluk izleriyle) ---
+    traces = {}
+    trace_decay = gamma * lam
+
+    def td_update(u, key, delta):
+        """
+        Q[key] değerini TD hatası (delta) ile günceller (key: u düğümündeki kenarın CSR pozisyonu).
+        λ > 0 ise yerine koyan (replacing) iz kullanılır: key'in izi 1'e çekilir ve
+        bu episode'da ziyaret edilmiş tüm (state, action) çiftleri izleri oranında güncellenir.
+        İz tablosu seyrektir; sadece bu episode'da dokunulan pozisyonları içerir.
+        """
+        if lam == 0:
+            Q[key] += alpha * delta
+            return
+        # Aynı durumda daha önce seçilmiş başka bir aksiyonun izi silinir (döngülere kredi verilmez).
+        lo, hi = indptr[u], indptr[u + 1]
+        for k in [k for k in traces if lo <= k < hi and k != key]:
+            del traces[k]
+        traces[key] = 1.0
+        for k, e in list(traces.items()):
+            Q[k] += alpha * delta * e
+            e *= trace_decay
+            if e < trace_cutoff:
+                del traces[k]
+            else:
+                traces[k] = e
+
+    total_steps = 0
 
     # --- Episode (Eğitim) Döngüsü ---
     for _ in range(episodes):
-        state = S
-        path = [state]
+        # Çağrı başına adım bütçesi dolduysa eğitimi bitir
+        if step_budget is not None and total_steps >= step_budget:
+            break
+
+        state = source
+        path = [S]
+        position = {S: 0}   # Yoldaki düğüm -> pozisyon (döngü tespiti için)
+        steps = 0
+        traces.clear()
 
         # Başlangıçta gidecek yer yoksa pes et
-        valid_neighbors = neighbors(state)
-        if not valid_neighbors:
+        if indptr[state] == indptr[state + 1]:
             continue
 
         # İlk aksiyonu seç (Epsilon-Greedy)
         # SARSA, döngüye girmeden önce ilk aksiyonu seçer.
-        if random.random() < epsilon:
-            action = random.choice(valid_neighbors)
-        else:
-            # Henüz Q tablosu boşsa rastgele, doluysa en iyisini seç
-            action = max(valid_neighbors, key=lambda a: Q[(state, a)]) if valid_neighbors else random.choice(valid_neighbors)
+        # 'pos' seçilen kenarın CSR pozisyonudur; aksiyon (gidilecek düğüm) nbr[pos]'tur.
+        pos = choose(state)
+        action = nbr[pos]
 
         # --- Adım (Step) Döngüsü ---
-        while state != D:
+        while state != target:
             next_state = action
-            path.append(next_state)
+            steps += 1
+            total_steps += 1
+
+            # Yolu güncelle: Düğüm zaten yoldaysa aradaki döngüyü sil (loop erasure)
+            node = nodes[next_state]
+            revisit = node in position
+            if revisit:
+                k = position[node]
+                for n in path[k + 1:]:
+                    del position[n]
+                del path[k + 1:]
+            else:
+                position[node] = len(path)
+                path.append(node)
 
             # 1. HEDEFE VARILDI MI?
-            if next_state == D:
+            if next_state == target:
                 # Toplam yol maliyetini hesapla
                 cost = compute_cost(G, path)
                 
@@ -189,7 +323,7 @@ def sarsa_route(G, S, D, min_bw, episodes=2000, seed=None):
                 
                 # Son güncellemeyi yap (Next state yok, terminal state)
                 # Q(s,a) = Q(s,a) + alpha * (reward - Q(s,a))
-                Q[(state, action)] += alpha * (reward - Q[(state, action)])
+                td_update(state, pos, reward - float(Q[pos]))
 
                 # En iyiyi güncelle
                 if cost < best_cost:
@@ -198,46 +332,216 @@ def sarsa_route(G, S, D, min_bw, episodes=2000, seed=None):
                 break
 
             # 2. SONRAKİ DURUMUN ANALİZİ
-            next_neighbors = neighbors(next_state)
-            if not next_neighbors:
+            if indptr[next_state] == indptr[next_state + 1]:
                 # Çıkmaz sokak (Dead End)!
                 # Çok büyük ceza ver (Negatif ödül)
                 reward = -500
-                Q[(state, action)] += alpha * (reward - Q[(state, action)])
+                td_update(state, pos, reward - float(Q[pos]))
                 break # Bu epizod yandı, çık.
 
             # 3. SONRAKİ AKSİYONU SEÇ (ON-POLICY)
             # SARSA'nın Q-Learning'den farkı burada:
             # Bir sonraki aksiyonu (next_action) ŞİMDİ seçiyoruz ve güncelleme formülünde onu kullanıyoruz.
-            if random.random() < epsilon:
-                next_action = random.choice(next_neighbors)
-            else:
-                next_action = max(next_neighbors, key=lambda a: Q[(next_state, a)])
+            next_pos = choose(next_state)
+            next_action = nbr[next_pos]
 
             # 4. ANLIK ÖDÜL / CEZA (STEP REWARD)
             # Her adım bir maliyettir. Ajanın yolu uzatmasını engellemek için
-            # o kenarın maliyetini negatif olarak (ceza) veriyoruz.
-            edge = G[state][next_state]
-            
-            # Kenar maliyet bileşenleri
-            d_val = edge.get("link_delay", edge.get("delay", 0))
-            r_val = -math.log(max(edge.get("link_rel", edge.get("reliability", 0.99)), 1e-12))
-            b_val = 1000.0 / max(edge.get("bandwidth", 1), 1e-6)
-            
-            edge_cost = (W_DELAY * d_val + W_RELIABILITY * r_val + W_RESOURCE * b_val)
-            
-            reward = -edge_cost  # Negatif maliyet
+            # o kenarın (önceden hesaplanmış) maliyetini negatif olarak (ceza) veriyoruz.
+            reward = -edge_cost[pos]
+            if revisit:
+                reward -= cycle_penalty
             
             # 5. SARSA GÜNCELLEMESİ
             # Q(s, a) = Q(s, a) + alpha * [ R + gamma * Q(s', a') - Q(s, a) ]
-            current_q = Q[(state, action)]
-            next_q = Q[(next_state, next_action)]
+            # Expected SARSA'da hedef, sonraki durumdaki politikanın beklenen değeridir.
+            current_q = float(Q[pos])
+            next_q = expected_q(next_state) if expected else float(Q[next_pos])
             
-            Q[(state, action)] = current_q + alpha * (reward + gamma * next_q - current_q)
+            td_update(state, pos, reward + gamma * next_q - current_q)
 
             # Durum ve Aksiyonu İlerle
             state = next_state
             action = next_action
+            pos = next_pos
+
+            # Episode adım sınırı veya çağrı bütçesi dolduysa episode'u kes
+            if steps >= max_episode_steps:
+                break
+            if step_budget is not None and total_steps >= step_budget:
+                break
+
+    return best_path, best_cost, total_steps
+
+
+# =================================================================================================
+# PARALEL EĞİTİM (EPISODE İŞÇİLERİ)
+# =================================================================================================
+# Her işçi süreç, Q-tablosunun yerel bir kopyası üzerinde kendi episode dilimini çalıştırır.
+# Her 'merge_every' episode'da bir kopyalar ana süreçte birleştirilir (ortalama veya maksimum)
+# ve birleşik tablo bir sonraki tur için tüm işçilere dağıtılır.
+# İşçi tohumları ana süreçte seed'den türetilir; sonuçlar işçi sırasıyla toplandığı için
+# aynı (seed, workers) çifti her zaman aynı sonucu verir.
+# İşçiler ada_modeli.file_worker_pool ile bu dosyadan yüklenir; modül importlib ile isimsiz
+# yüklendiğinde de (ör. Arayuz.py) fonksiyonlar pickle edilmeden çalışır.
+def _init_sarsa_worker(G, F, S, D, params):
+    """İşçi başlatıcısı: Graf ve CSR dizileri bir kez saklanır, episode görev fonksiyonu döndürülür."""
+    def run_slice(task):
+        """Bir işçinin tek tur episode dilimini çalıştırır: (Q, episode sayısı, tohum, adım bütçesi)."""
+        Q, episodes, worker_seed, budget = task
+        rng = random.Random(worker_seed)
+        path, cost, steps = run_sarsa_episodes(G, F, Q, S, D, episodes, rng,
+                                               step_budget=budget, **params)
+        return Q, path, cost, steps
+
+    return run_slice
+
+
+def merge_q_tables(tables, mode="mean"):
+    """İşçilerin Q kopyalarını birleştirir: "mean" (ortalama) veya "max" (eleman bazında maksimum)."""
+    stack = np.stack(tables)
+    if mode == "max":
+        return stack.max(axis=0)
+    if mode == "mean":
+        return stack.mean(axis=0).astype(stack.dtype)
+    raise ValueError(f"Bilinmeyen birleştirme modu: {mode}")
+
+
+def _parallel_sarsa(G, F, Q, S, D, episodes, rng, workers, merge_every, merge, step_budget, params):
+    """
+    Episode'ları 'workers' sürece böler ve Q kopyalarını her 'merge_every' episode'da birleştirir.
+    İşçi tohumları ana sürecin rng'sinden sırayla çekilir.
+
+    Returns:
+        tuple: (birleşik Q, en iyi yol, en iyi maliyet)
+    """
+    # Kalan episode'lar ilk işçilere birer birer dağıtılır; toplam tam olarak 'episodes' olur.
+    base, extra = divmod(episodes, workers)
+    remaining = [base + (1 if k < extra else 0) for k in range(workers)]
+    budgets = [None] * workers
+    if step_budget is not None:
+        budgets = [step_budget // workers] * workers
+
+    best_path = None
+    best_cost = float("inf")
+
+    with file_worker_pool(workers, (os.path.abspath(__file__), "_init_sarsa_worker"),
+                          (G, F, S, D, params)) as pool:
+        while any(remaining):
+            # Sadece episode'u kalan işçiler bu tura katılır (boş kopyalar birleştirmeyi seyreltmez).
+            active = [k for k in range(workers) if remaining[k] > 0]
+            tasks = []
+            for k in active:
+                chunk = min(merge_every, remaining[k])
+                remaining[k] -= chunk
+                tasks.append((Q, chunk, rng.getrandbits(64), budgets[k]))
+
+            # map() sonuçları işçi sırasıyla döndürür -> birleştirme deterministiktir
+            results = pool.map(run_file_task, tasks)
+
+            for k, (_, path, cost, steps) in zip(active, results):
+                if path is not None and cost < best_cost:
+                    best_path, best_cost = path, cost
+                if budgets[k] is not None:
+                    budgets[k] -= steps
+                    if budgets[k] <= 0:
+                        remaining[k] = 0
+            Q = merge_q_tables([r[0] for r in results], merge)
+
+    return Q, best_path, best_cost
+
+
+def sarsa_route(G, S, D, min_bw, episodes=2000, seed=None, q_store=None,
+                lam=LAMBDA, trace_cutoff=TRACE_CUTOFF,
+                max_episode_steps=MAX_EPISODE_STEPS, step_budget=STEP_BUDGET,
+                cycle_penalty=CYCLE_PENALTY, expected=False, q_dtype=Q_DTYPE, stats=None,
+                workers=WORKERS, merge_every=MERGE_EVERY, merge=MERGE_MODE, rng=None):
+    """
+    SARSA algoritması ile Kaynak(S) -> Hedef(D) arasında yol bulur.
+    min_bw: Sadece bant genişliği bu değerden yüksek olan kenarlar kullanılır.
+    seed: Tekrarlanabilirlik için rastgele sayı üreteci başlangıç değeri.
+    q_store: (Opsiyonel) q_tablosu.QTableStore. Verilirse Q-tablosu kayıtlı tablodan
+             başlatılır (warm start) ve eğitim sonunda kaydedilir.
+    lam: SARSA(λ) iz azalma katsayısı. 0 ise klasik tek adımlı SARSA çalışır.
+         λ > 0 iken hedef ödülü tek episode'da yol boyunca kaynağa doğru yayılır.
+    trace_cutoff: γλ ile azalan izlerden bu eşiğin altına düşenler silinir.
+    max_episode_steps: Bir episode en fazla bu kadar adım sürer, sonra kesilir.
+    step_budget: Tüm episode'lar için toplam adım bütçesi; dolunca eğitim erken biter
+                 ve o ana kadarki en iyi yol döndürülür (None = sınırsız).
+    cycle_penalty: Ajan yoldaki bir düğüme geri döndüğünde adım cezasına eklenir.
+    expected: True ise Expected SARSA çalışır; güncelleme hedefi, örneklenen Q(s', a')
+              yerine s' düğümündeki epsilon-greedy politikanın beklenen Q değeridir.
+              Güncelleme varyansı düştüğü için genelde daha az episode ile yakınsar.
+    q_dtype: Q dizisinin tipi ("float32" veya çok büyük graflar için "float16").
+    stats: (Opsiyonel) dict. Verilirse Q-tablosu ve CSR dizilerinin bellek kullanımı yazılır
+           (q_entries, q_bytes, csr_bytes, q_dtype).
+    workers: 1'den büyükse episode'lar bu kadar süreçte paralel çalıştırılır. Her işçinin
+             rastgele sayı akışı seed'den türetilir; sabit (seed, workers) için sonuç tekrarlanabilir.
+    merge_every: Paralel modda işçi başına kaç episode'da bir Q kopyalarının birleştirileceği.
+    merge: Birleştirme yöntemi: "mean" (ortalama) veya "max" (iyimser, eleman bazında maksimum).
+    rng: (Opsiyonel) random.Random. Verilmezse seed ile çağrıya özel bir üreteç oluşturulur;
+         global 'random' durumu değiştirilmez, eşzamanlı thread'lerde çağrılar birbirini bozmaz.
+    
+    Ajanın kaydedilen yolu döngüsüzdür: bir düğüme geri dönüldüğünde aradaki döngü
+    yoldan silinir (loop erasure). Böylece yol listesi düğüm sayısını aşmaz ve
+    maliyet döngüsüz yol üzerinden hesaplanır.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+
+    # Geçerli komşular ve kenar maliyetleri bir kez hesaplanır (min_bw, ağırlıklar için).
+    weights = (W_DELAY, W_RELIABILITY, W_RESOURCE)
+    F = build_feasible_arrays(G, min_bw, weights)
+    nodes = F["nodes"]
+    indptr, nbr, edge_cost = F["indptr"], F["nbr"], F["cost"]
+
+    # Q-Tablosu: CSR kenar pozisyonuyla indekslenen düz bir dizi.
+    # Q[p] = Q(state, action), burada p state'in komşu dilimindeki action kenarının pozisyonudur.
+    # Tuple anahtarlı sözlüğe göre kayıt başına >100 bayt yerine 4 (float32) veya 2 (float16) bayt.
+    Q = np.zeros(len(nbr), dtype=q_dtype)
+
+    # Kayıtlı tablo varsa (aynı hedef, ağırlık ve bant genişliği için) oradan başla
+    store_tag = f"bw{min_bw:g}"
+    if q_store:
+        saved = q_store.warm_start(G, D, weights, tag=store_tag)
+        for u in range(len(nodes)):
+            for p in range(indptr[u], indptr[u + 1]):
+                key = (nodes[u], nodes[nbr[p]])
+                if key in saved:
+                    Q[p] = saved[key]
+
+    if stats is not None:
+        stats["q_entries"] = len(Q)
+        stats["q_bytes"] = Q.nbytes
+        stats["csr_bytes"] = (indptr.itemsize * len(indptr) + nbr.itemsize * len(nbr)
+                              + edge_cost.itemsize * len(edge_cost))
+        stats["q_dtype"] = str(Q.dtype)
+    
+    # Hiperparametreler
+    params = {
+        "alpha": 0.1,     # Öğrenme hızı
+        "gamma": 0.95,    # İndirim faktörü
+        "epsilon": 0.3,   # Keşif oranı
+        "lam": lam,
+        "trace_cutoff": trace_cutoff,
+        "max_episode_steps": max_episode_steps,
+        "cycle_penalty": cycle_penalty,
+        "expected": expected,
+    }
+
+    if workers > 1:
+        Q, best_path, best_cost = _parallel_sarsa(G, F, Q, S, D, episodes, rng, workers,
+                                                  merge_every, merge, step_budget, params)
+    else:
+        best_path, best_cost, _ = run_sarsa_episodes(G, F, Q, S, D, episodes, rng,
+                                                     step_budget=step_budget, **params)
+
+    if q_store:
+        table = {}
+        for u in range(len(nodes)):
+            for p in range(indptr[u], indptr[u + 1]):
+                table[(nodes[u], nodes[nbr[p]])] = float(Q[p])
+        q_store.save(G, table, D, weights, tag=store_tag)
 
     return best_path, best_cost
 
@@ -299,10 +603,12 @@ if __name__ == "__main__":
     demands = load_demands()
 
     for i, (s, d, bw) in enumerate(demands, 1):
-        path, cost = sarsa_route(G, s, d, bw)
+        stats = {}
+        path, cost = sarsa_route(G, s, d, bw, stats=stats)
+        mem = f"Q={stats['q_entries']} kayıt, {stats['q_bytes'] / 1024:.1f} KB ({stats['q_dtype']})"
         if path:
-            print(f"Test #{i:02d} | {s} -> {d} ({bw} Mbps) | ✅ Cost={cost:.4f}")
+            print(f"Test #{i:02d} | {s} -> {d} ({bw} Mbps) | ✅ Cost={cost:.4f} | {mem}")
         else:
-            print(f"Test #{i:02d} | {s} -> {d} ({bw} Mbps) | ❌ Başarısız")
+            print(f"Test #{i:02d} | {s} -> {d} ({bw} Mbps) | ❌ Başarısız | {mem}")
 
     print("\n✅ Tüm testler tamamlandı.")
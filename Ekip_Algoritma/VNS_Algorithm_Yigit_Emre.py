@@ -132,8 +132,9 @@ class VNS:
     def __init__(self, graph):
         self.graph = graph
 
-    def initial_path(self, src, dst):
+    def initial_path(self, src, dst, rng=None):
         """BFS ile rastgele bir başlangıç yolu bulur. (VNS için bir tohum çözüm)"""
+        rng = rng if rng is not None else random.Random()
         queue = deque([(src, [src])])
         visited = {src}
 
@@ -143,7 +144,7 @@ class VNS:
                 return path
 
             nbrs = list(self.graph.edges[cur].keys())
-            random.shuffle(nbrs) # Rastgelelik ekle (Hep aynı yolu bulmasın)
+            rng.shuffle(nbrs) # Rastgelelik ekle (Hep aynı yolu bulmasın)
 
             for n in nbrs:
                 if n not in visited:
@@ -151,12 +152,13 @@ class VNS:
                     queue.append((n, path + [n]))
         return None
 
-    def shake(self, path, k):
+    def shake(self, path, k, rng=None):
         """
         Çalkalama (Shaking) Fonksiyonu:
         Mevcut yoldan rastgele bir parçayı değiştirerek yerel minimumdan kaçmayı sağlar.
         k parametresi, değişikliğin (perturbation) şiddetini belirler (Komşuluk derecesi).
         """
+        rng = rng if rng is not None else random.Random()
         if len(path) < 4:
             return path
 
@@ -164,7 +166,7 @@ class VNS:
         
         # Yol üzerinde rastgele bir segment seç (i -> j arası)
         # k arttıkça aralık genişleyebilir veya daha farklı bir node seçilebilir.
-        i = random.randint(1, len(new_path) - 3)
+        i = rng.randint(1, len(new_path) - 3)
         j = min(len(new_path) - 1, i + k + 1) # k burada segment uzunluğunu etkiliyor
 
         start = new_path[i - 1]
@@ -180,7 +182,7 @@ class VNS:
             if len(sub) > 6: # Çok uzatmamak için derinlik sınırı
                 return False
             nbrs = list(self.graph.edges[cur].keys())
-            random.shuffle(nbrs)
+            rng.shuffle(nbrs)
             for n in nbrs:
                 if n not in visited:
                     visited.add(n)
@@ -226,17 +228,19 @@ class VNS:
                     break
         return best
 
-    def run(self, src, dst, seed=None):
+    def run(self, src, dst, seed=None, rng=None):
         """
         VNS Algoritmasının Ana Döngüsü:
         1. Shaking -> Rastgele değiştir
         2. Local Search -> İyileştir
         3. Karşılaştır -> İyiyse kabul et, değilse K'yı artır (daha uzağa bak)
         4. seed -> Tekrarlanabilirlik için
+        5. rng -> (Opsiyonel) random.Random; verilmezse seed ile çağrıya özel oluşturulur
+           (global 'random' durumu kullanılmaz, eşzamanlı çağrılar birbirini bozmaz)
         """
-        if seed is not None:
-            random.seed(seed)
-        path = self.initial_path(src, dst)
+        if rng is None:
+            rng = random.Random(seed)
+        path = self.initial_path(src, dst, rng)
         if not path:
             return None, None
 
@@ -247,7 +251,7 @@ class VNS:
             k = 1
             while k <= K_MAX:
                 # 1. Shaking
-                shaken = self.shake(best_path, k)
+                shaken = self.shake(best_path, k, rng)
                 # 2. Local Search
                 improved = self.local_search(shaken)
                 # 3. İyileşme Kontrolü
@@ -0,0 +1,273 @@
+"""
+Ada Modeli (Island Model) Paralel Genetik Algoritma Modülü
+
+Tek bir büyük popülasyon yerine N bağımsız "ada" (alt popülasyon) ayrı süreçlerde evrimleşir.
+Her M nesilde bir, her adanın en iyi K bireyi halka (ring) topolojisinde bir sonraki adaya
+göç eder ve oradaki en kötü bireylerin yerini alır. Adalar arası göç çeşitliliği korurken
+iyi yol parçalarının yayılmasını sağlar.
+
+Bu modül algoritmadan bağımsızdır; bir adanın M nesillik bir dönemi (epoch), GA modülündeki
+bir fonksiyon tarafından çalıştırılır:
+
+    epoch_fn(G, params, generations, rng, population, fitness_cache)
+        -> (en iyi yol, en iyi maliyet, [(yol, maliyet), ...] maliyete göre sıralı son popülasyon)
+
+Fonksiyon (dosya yolu, fonksiyon adı) ile verilir ve işçi süreçte dosyadan yüklenir;
+böylece modül hangi adla import edilmiş olursa olsun (ör. Arayuz.py'deki gibi) çalışır.
+Aynı yöntem file_worker_pool() ile diğer paralel algoritmalara da (ör. ACO karıncaları) açıktır.
+
+Topoloji Paylaşımı:
+- Düğüm ve kenarların sayısal özellikleri multiprocessing.shared_memory bloklarına yazılır.
+- Her işçi süreç grafı başlangıçta bir kez bu bloklardan kurar; görevlerle graf gönderilmez.
+
+Tekrarlanabilirlik:
+- Her ada ve dönem için tohumlar ana süreçte seed'den sırayla çekilir.
+- Sonuçlar ada sırasıyla toplanır; sabit (seed, ada sayısı) her zaman aynı sonucu verir.
+"""
+
+import os
+import sys
+import math
+import random
+import contextlib
+import importlib.util
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+import networkx as nx
+
+from fitness_onbellegi import FitnessCache
+
+# Varsayılan Ada Modeli Ayarları
+ISLANDS = 4              # Ada (işçi süreç) sayısı
+MIGRATION_INTERVAL = 10  # Kaç nesilde bir göç yapılacağı
+MIGRANTS = 2             # Her göçte bir adadan komşusuna giden en iyi birey sayısı
+
+
+# =================================================================================================
+# TOPOLOJİNİN PAYLAŞILAN BELLEĞE YAZILMASI
+# =================================================================================================
+def share_array(arr):
+    """
+    NumPy dizisini yeni bir paylaşılan bellek bloğuna kopyalar.
+
+    Returns:
+        tuple: (SharedMemory bloğu, işçilere gönderilecek (ad, şekil, dtype) tanımı)
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def attach_array(ref):
+    """
+    share_array() ile paylaşılan diziye bağlanır (kopyalamadan).
+
+    Returns:
+        tuple: (SharedMemory bloğu, blok üzerindeki NumPy görünümü)
+        Blok, görünüm artık kullanılmayınca close() edilmelidir.
+    """
+    name, shape, dtype = ref
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def share_graph(G):
+    """
+    Grafın sayısal düğüm/kenar özelliklerini paylaşılan belleğe yazar.
+
+    Returns:
+        tuple: (SharedMemory blokları listesi, işçilere gönderilecek küçük tanım sözlüğü)
+        Bloklar iş bitince çağıran tarafından close() + unlink() edilmelidir.
+    """
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    node_attrs = sorted({k for _, d in G.nodes(data=True) for k, v in d.items()
+                         if isinstance(v, (int, float))})
+    edge_attrs = sorted({k for _, _, d in G.edges(data=True) for k, v in d.items()
+                         if isinstance(v, (int, float))})
+
+    node_arr = np.full((len(nodes), len(node_attrs)), np.nan)
+    for n, d in G.nodes(data=True):
+        for j, k in enumerate(node_attrs):
+            if k in d:
+                node_arr[index[n], j] = d[k]
+
+    # İlk iki sütun kenarın uç düğüm indeksleridir
+    edge_arr = np.full((G.number_of_edges(), 2 + len(edge_attrs)), np.nan)
+    for i, (u, v, d) in enumerate(G.edges(data=True)):
+        edge_arr[i, 0], edge_arr[i, 1] = index[u], index[v]
+        for j, k in enumerate(edge_attrs):
+            if k in d:
+                edge_arr[i, 2 + j] = d[k]
+
+    blocks = []
+    spec = {"nodes": nodes, "directed": G.is_directed(),
+            "node_attrs": node_attrs, "edge_attrs": edge_attrs}
+    for key, arr in (("node_shm", node_arr), ("edge_shm", edge_arr)):
+        shm, spec[key] = share_array(arr)
+        blocks.append(shm)
+    return blocks, spec
+
+
+def attach_graph(spec):
+    """share_graph() ile yazılan bloklardan NetworkX grafını yeniden kurar."""
+    arrays = []
+    for key in ("node_shm", "edge_shm"):
+        shm, arr = attach_array(spec[key])
+        arrays.append(arr.copy())
+        del arr
+        shm.close()
+    node_arr, edge_arr = arrays
+
+    nodes = spec["nodes"]
+    G = nx.DiGraph() if spec["directed"] else nx.Graph()
+    for i, n in enumerate(nodes):
+        G.add_node(n, **{k: float(x) for k, x in zip(spec["node_attrs"], node_arr[i])
+                         if not math.isnan(x)})
+    for row in edge_arr:
+        G.add_edge(nodes[int(row[0])], nodes[int(row[1])],
+                   **{k: float(x) for k, x in zip(spec["edge_attrs"], row[2:]) if not math.isnan(x)})
+    return G
+
+
+# =================================================================================================
+# İŞÇİ SÜREÇ
+# =================================================================================================
+_WORKER_CONTEXT = None
+
+
+def _load_function(ref):
+    """(dosya yolu, fonksiyon adı) ile verilen fonksiyonu dosyadan yükler."""
+    path, name = ref
+    # GA modülünün kendi yardımcı modüllerini (ör. fitness_onbellegi) bulabilmesi için
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    module_name = "_ada_" + os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+_FILE_TASK = None
+
+
+def _init_file_worker(init_ref, initargs):
+    """
+    Genel işçi başlatıcısı: (dosya yolu, fonksiyon adı) ile verilen başlatıcı yüklenir ve
+    çalıştırılır; döndürdüğü görev fonksiyonu bu süreçteki tüm görevler için saklanır.
+    """
+    global _FILE_TASK
+    _FILE_TASK = _load_function(init_ref)(*initargs)
+
+
+def run_file_task(task):
+    """file_worker_pool() havuzunun görev fonksiyonu: İşçide saklanan fonksiyonu çağırır."""
+    return _FILE_TASK(task)
+
+
+def file_worker_pool(processes, init_ref, initargs):
+    """
+    Görev fonksiyonu dosyadan yüklenen bir süreç havuzu oluşturur.
+
+    Modüller importlib ile isimsiz yüklendiğinde (ör. Arayuz.py) fonksiyonları referansla
+    pickle edilemez. Bu havuzda görevler her zaman run_file_task ile gönderilir; asıl iş
+    init_ref fonksiyonunun (*initargs ile) işçide döndürdüğü fonksiyondur:
+
+        with file_worker_pool(4, (__file__, "_init_worker"), (spec,)) as pool:
+            results = pool.map(run_file_task, tasks)
+    """
+    return multiprocessing.Pool(processes, initializer=_init_file_worker,
+                                initargs=(init_ref, initargs))
+
+
+def _init_island_worker(graph_spec, epoch_ref, params):
+    """İşçi başlatıcısı: Graf paylaşılan bellekten bir kez kurulur, GA fonksiyonu bir kez yüklenir."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (attach_graph(graph_spec), _load_function(epoch_ref), params, FitnessCache())
+
+
+def _island_task(task):
+    """Bir adanın bir dönemini (M nesil) çalıştırır."""
+    G, epoch_fn, params, cache = _WORKER_CONTEXT
+    population, generations, island_seed = task
+    # GA fonksiyonlarının ilerleme çıktıları işçilerde bastırılır
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return epoch_fn(G, params, generations, random.Random(island_seed), population, cache)
+
+
+# =================================================================================================
+# ADA MODELİ ANA DÖNGÜSÜ
+# =================================================================================================
+def migrate(populations, migrants):
+    """
+    Halka göçü: i. adanın en iyi 'migrants' bireyi (i+1). adaya gider ve oradaki en kötü
+    bireylerin yerini alır. Hedef adada zaten bulunan yollar tekrar eklenmez.
+    Popülasyonlar maliyete göre sıralı [(yol, maliyet), ...] listeleridir.
+    """
+    n = len(populations)
+    result = []
+    for i in range(n):
+        population = list(populations[i])
+        present = {tuple(p) for p, _ in population}
+        incoming = [(p, c) for p, c in populations[(i - 1) % n][:migrants] if tuple(p) not in present]
+        if incoming:
+            population = population[:max(0, len(population) - len(incoming))] + incoming
+            population.sort(key=lambda x: x[1])
+        result.append(population)
+    return result
+
+
+def run_islands(G, epoch_ref, params, generations, islands=ISLANDS,
+                migration_interval=MIGRATION_INTERVAL, migrants=MIGRANTS, seed=None, rng=None):
+    """
+    Ada modeli GA'yı çalıştırır.
+
+    Args:
+        G: NetworkX grafı
+        epoch_ref: (dosya yolu, fonksiyon adı) - bir adanın dönemini çalıştıran fonksiyon
+        params: dict - GA fonksiyonuna iletilen talep/parametreler (picklable olmalı)
+        generations: Toplam nesil sayısı (her adada)
+        islands: Ada (süreç) sayısı
+        migration_interval: Göç aralığı (nesil)
+        migrants: Göç eden en iyi birey sayısı
+        seed / rng: Tekrarlanabilirlik için tohum veya random.Random örneği
+
+    Returns:
+        tuple: (en iyi yol, en iyi maliyet)
+    """
+    if rng is None:
+        rng = random.Random(seed)
+
+    best_path = None
+    best_cost = float("inf")
+    populations = [None] * islands
+
+    blocks, spec = share_graph(G)
+    try:
+        with multiprocessing.Pool(islands, initializer=_init_island_worker,
+                                  initargs=(spec, epoch_ref, params)) as pool:
+            done = 0
+            while done < generations:
+                chunk = min(migration_interval, generations - done)
+                done += chunk
+                tasks = [(populations[i], chunk, rng.getrandbits(64)) for i in range(islands)]
+
+                # map() sonuçları ada sırasıyla döndürür -> göç ve en iyi seçimi deterministiktir
+                results = pool.map(_island_task, tasks)
+
+                for path, cost, _ in results:
+                    if path is not None and cost < best_cost:
+                        best_path, best_cost = list(path), cost
+                if all(not pop for _, _, pop in results):
+                    break   # Hiçbir adada geçerli birey yok (ör. bant genişliği kısıtı)
+                populations = migrate([pop for _, _, pop in results], migrants)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    return best_path, best_cost
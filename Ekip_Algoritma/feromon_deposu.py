@@ -0,0 +1,150 @@
+"""
+Feromon Deposu ve Talepler Arası Sıcak Başlangıç (Warm Start) Modülü
+
+Toplu testlerde her talep için ACO feromonları 1.0'dan başlar; oysa talepler ağın
+büyük bölümünü paylaşır ve önceki taleplerin öğrendiği iyi kenarlar sonrakiler için de iyidir.
+
+Bu modüldeki PheromoneStore, bir ACO çözümünün son feromon değerlerini saklar ve
+sonraki taleplere sönümlenmiş (damped) bir kopyasını başlangıç olarak verir:
+
+    tau_başlangıç = 1.0 + damping * (tau_kayıtlı - 1.0)
+
+Anahtar:
+- Topoloji sürümü (q_tablosu.topology_version): Graf değişirse eski kayıt kullanılmaz.
+- Ağırlıklar: Farklı QoS ağırlıkları farklı yolları ödüllendirir.
+- Bant genişliği sınıfı: min_bw, PHEROMONE_BW_CLASS genişliğinde sınıflara ayrılır;
+  yakın bant genişliği talepleri aynı kenar kümesini kullandığı için kaydı paylaşır.
+
+Feromonlar grafın tüm yönlü kenarları üzerinde kanonik sırayla (düğüm sırası, sonra
+G.neighbors() sırası) tutulur; her ACO çözümü kendi geçerli kenarlarını bu sıraya
+eşleyen 'gpos' dizisiyle okur/yazar. Böylece farklı min_bw ile kurulan diziler
+aynı kaydı paylaşabilir.
+
+Kalıcılık (opsiyonel): directory verilirse kayıtlar .npz olarak yazılır ve sonraki
+oturumlarda aynı anahtar için diskten yüklenir.
+
+Sürüm: topology_version(G) tüm grafı özetler (büyük graflarda pahalıdır). ACOSolver.solve onu
+çözüm başına bir kez hesaplar; graf değişmeden birçok talep çalıştıran toplu testler de bir kez
+hesaplayıp 'version' / 'graph_version' olarak verir. Graf değişirse yeni sürüm hesaplanmalıdır.
+
+Tekrarlı ölçümler: Aynı talebin tekrarları birbirinin izinden başlamamalıdır (istatistikler
+bağımsız örnek olmaz). snapshot() ilk tekrardan önce alınan salt okunur bir kopya döndürür;
+sonraki tekrarlar bu kopyayla çalışır, depoyu sadece ilk tekrar günceller.
+"""
+
+import os
+import numpy as np
+
+from q_tablosu import topology_version
+
+# Varsayılan Depo Ayarları
+PHEROMONE_DAMPING = 0.5     # Kayıtlı feromonun başlangıca aktarılan oranı (0 = hiç, 1 = aynen)
+PHEROMONE_BW_CLASS = 100.0  # Bant genişliği sınıfı genişliği (Mbps)
+
+
+class PheromoneStore:
+    """
+    (topoloji, ağırlıklar, bant genişliği sınıfı) anahtarlı feromon deposu.
+
+    Kullanım:
+        store = PheromoneStore()                     # Sadece bellekte (bir toplu test boyunca)
+        store = PheromoneStore("feromonlar")         # Diske de kaydeder (oturumlar arası)
+        for S, D, B in demands:
+            ACOSolver.solve(G, S, D, weights, B, pheromone_store=store)
+        # Graf talepler boyunca değişmiyorsa sürüm bir kez hesaplanır:
+        version = topology_version(G)
+        ACOSolver.solve(G, S, D, weights, B, pheromone_store=store, graph_version=version)
+    """
+    def __init__(self, directory=None, damping=PHEROMONE_DAMPING, bw_class=PHEROMONE_BW_CLASS):
+        self.directory = directory
+        self.damping = damping
+        self.bw_class = bw_class
+        self._data = {}
+        self.read_only = False   # snapshot() kopyaları save() çağrılarını yok sayar
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, G, weights, min_bw, version=None):
+        """
+        Talep için depo anahtarı: (sürüm, ağırlıklar, bant genişliği sınıfı).
+        version verilmezse topology_version(G) hesaplanır; düğüm/kenar özelliklerindeki her
+        değişiklik (gecikme, bant genişliği, güvenilirlik) yeni bir anahtar verir.
+        """
+        if version is None:
+            version = topology_version(G)
+        weights_key = "-".join(f"{w:.4f}" for w in weights)
+        return version, weights_key, int(min_bw // self.bw_class)
+
+    def filename(self, key):
+        version, weights_key, bw_class = key
+        return os.path.join(self.directory, f"feromon_{weights_key}_bw{bw_class}_{version}.npz")
+
+    def _load(self, key):
+        """Anahtarın kanonik feromon dizisini döndürür (bellekte yoksa diskten yükler)."""
+        tau = self._data.get(key)
+        if tau is None and self.directory is not None:
+            fpath = self.filename(key)
+            if os.path.exists(fpath):
+                with np.load(fpath) as data:
+                    tau = self._data[key] = data["tau"].astype(np.float64)
+        return tau
+
+    def warm_start(self, G, weights, min_bw, gpos, initial=1.0, version=None):
+        """
+        Verilen kenar pozisyonları için sönümlenmiş başlangıç feromonlarını döndürür.
+
+        Args:
+            gpos: Çözümün geçerli kenarlarının kanonik pozisyonları (build_aco_arrays)
+            initial: Kayıt yokken kullanılan başlangıç feromonu
+            version: (Opsiyonel) Önceden hesaplanmış topology_version(G)
+
+        Returns:
+            np.ndarray veya None (bu anahtar için kayıt yoksa)
+        """
+        tau = self._load(self.key(G, weights, min_bw, version))
+        if tau is None:
+            return None
+        return initial + self.damping * (tau[gpos] - initial)
+
+    def snapshot(self, G, weights, min_bw, version=None):
+        """
+        Talebin anahtarındaki feromonların o anki halinin salt okunur kopyasını döndürür.
+        Kopya warm_start() ile aynı başlangıcı verir; save() çağrıları kopyayı değiştirmez.
+        """
+        copy = PheromoneStore(damping=self.damping, bw_class=self.bw_class)
+        copy.read_only = True
+        key = self.key(G, weights, min_bw, version)
+        tau = self._load(key)
+        if tau is not None:
+            copy._data[key] = tau.copy()
+        return copy
+
+    def save(self, G, weights, min_bw, gpos, slots, values, initial=1.0, version=None):
+        """
+        Çözümün son feromonlarını depoya yazar. Çözümün kullanamadığı kenarların
+        (ör. bant genişliği yetersiz) önceki kayıtlı değerleri korunur.
+
+        Args:
+            gpos: Kenar pozisyonlarının kanonik karşılıkları
+            slots: Kanonik dizinin uzunluğu (grafın yönlü kenar sayısı)
+            values: gpos ile aynı sıradaki feromon değerleri
+            version: (Opsiyonel) Önceden hesaplanmış topology_version(G)
+        """
+        if self.read_only:
+            return
+        key = self.key(G, weights, min_bw, version)
+        tau = self._load(key)
+        if tau is None or len(tau) != slots:
+            tau = self._data[key] = np.full(slots, initial, dtype=np.float64)
+        tau[gpos] = values
+
+        if self.directory is not None:
+            # np.savez_compressed uzantı eklemesin diye dosya nesnesi kullanılır
+            with open(self.filename(key), "wb") as f:
+                np.savez_compressed(f, tau=tau.astype(np.float32))
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
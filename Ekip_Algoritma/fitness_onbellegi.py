@@ -0,0 +1,69 @@
+"""
+Fitness (Uygunluk) Önbelleği Modülü
+
+Genetik algoritmalarda aynı yol (birey) nesiller boyunca defalarca skorlanır:
+elitler her nesilde yeniden değerlendirilir, çaprazlama ebeveyni geri döndürebilir,
+yakınsamış popülasyonlar büyük ölçüde aynı yollardan oluşur.
+
+Bu modül, yol -> maliyet eşlemesini saklayan boyut sınırlı (LRU) bir önbellek sağlar.
+- Anahtar: Yolun tuple hali (ör. (0, 5, 12, 19))
+- Değer: Yolun maliyeti (geçersiz yollar için float('inf'))
+- Boyut dolduğunda en uzun süredir kullanılmayan kayıt atılır.
+
+Aynı talep (aynı graf, bant genişliği ve ağırlıklar) için yapılan tekrar çalıştırmalarda
+tek bir önbellek paylaşılabilir. bind() ile verilen bağlam (ör. (bw, ağırlıklar))
+değişirse önbellek kendini temizler; böylece farklı bir talebin maliyetleri yanlışlıkla
+kullanılmaz. Graf değişirse önbellek çağıran tarafından temizlenmelidir.
+"""
+
+from collections import OrderedDict
+
+# Varsayılan en fazla kayıt sayısı
+FITNESS_CACHE_SIZE = 20000
+
+
+class FitnessCache:
+    """
+    Boyut sınırlı yol maliyeti önbelleği.
+
+    Kullanım:
+        cache = FitnessCache()
+        cache.bind((bw, weights))
+        cost = cache.get(path, lambda p: weighted_cost(G, p, *weights))
+    """
+    def __init__(self, maxsize=FITNESS_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.context = None
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def bind(self, context):
+        """Önbelleği bir bağlama (ör. (bw, ağırlıklar)) bağlar; bağlam değiştiyse kayıtları siler."""
+        if context != self.context:
+            self._data.clear()
+            self.context = context
+
+    def get(self, path, compute):
+        """Yolun maliyetini döndürür; önbellekte yoksa compute(path) ile hesaplayıp saklar."""
+        key = tuple(path)
+        data = self._data
+        if key in data:
+            self.hits += 1
+            data.move_to_end(key)
+            return data[key]
+
+        self.misses += 1
+        value = compute(path)
+        data[key] = value
+        if len(data) > self.maxsize:
+            data.popitem(last=False)   # En eski (en az yakın zamanda kullanılan) kayıt
+        return value
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,82 @@
+"""
+Kararlı Durum (Steady-State) GA Popülasyonu Modülü
+
+Nesilsel (generational) GA her nesilde tüm popülasyonu yeniden kurar ve sıralar (O(P log P)).
+Kararlı durum GA'da ise her adımda tek bir çocuk üretilir ve popülasyona sadece
+yeni (daha önce popülasyonda olmayan) ve en kötü bireyden daha iyi ise girer.
+
+SteadyStatePopulation bu işlemi iki yapıyla O(log P) sürede yapar:
+- Yığın (heap): (-maliyet, sıra, yol) girdileri; heap[0] her zaman en kötü bireydir.
+- Karma kümesi (hash set): Popülasyondaki yolların tuple imzaları; kopya çocuklar
+  O(1) ile reddedilir ve popülasyon aynı yolla dolmaz.
+
+En iyi birey ayrıca tutulur; her iyileşme anında görülebilir (anytime best-so-far).
+"""
+
+import heapq
+
+
+class SteadyStatePopulation:
+    """
+    Sabit kapasiteli, kopyasız, maliyete göre en kötüsü atılan popülasyon.
+
+    Kullanım:
+        pool = SteadyStatePopulation(pop_size)
+        for p in initial_paths:
+            pool.offer(p, fitness(p))
+        child = crossover(pool.tournament(rng), pool.tournament(rng))
+        pool.offer(child, fitness(child))
+        pool.best_path, pool.best_cost
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._heap = []      # (-maliyet, sıra, yol): en kötü birey en üstte
+        self._keys = set()   # Popülasyondaki yolların imzaları
+        self._seq = 0        # Eşit maliyette önce eklenen önce atılır
+        self.best_path = None
+        self.best_cost = float("inf")
+
+    def offer(self, path, cost):
+        """
+        Yolu popülasyona eklemeyi dener.
+        Kopya, geçersiz (sonsuz maliyetli) veya popülasyon doluyken en kötüden iyi olmayan yol reddedilir.
+
+        Returns:
+            bool: Yol popülasyona girdiyse True
+        """
+        key = tuple(path)
+        if key in self._keys or cost == float("inf"):
+            return False
+
+        entry = (-cost, self._seq, path)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, entry)
+        elif cost < -self._heap[0][0]:
+            _, _, evicted = heapq.heapreplace(self._heap, entry)
+            self._keys.discard(tuple(evicted))
+        else:
+            return False
+
+        self._seq += 1
+        self._keys.add(key)
+        if cost < self.best_cost:
+            self.best_path, self.best_cost = path, cost
+        return True
+
+    def worst_cost(self):
+        return -self._heap[0][0] if self._heap else float("inf")
+
+    def tournament(self, rng, k=3):
+        """Turnuva seçimi: Rastgele k birey arasından maliyeti en düşük olanın yolu."""
+        candidates = rng.sample(self._heap, min(k, len(self._heap)))
+        return max(candidates)[2]   # -maliyet en büyük = maliyet en küçük
+
+    def items(self):
+        """Popülasyonu maliyete göre sıralı [(yol, maliyet), ...] olarak döndürür."""
+        return [(path, -neg) for neg, _, path in sorted(self._heap, reverse=True)]
+
+    def __contains__(self, path):
+        return tuple(path) in self._keys
+
+    def __len__(self):
+        return len(self._heap)
@@ -0,0 +1,101 @@
+"""
+Kısıtlı Rastgele Yol Üretimi Modülü
+
+Genetik algoritmalar başlangıç popülasyonunu ve mutasyonları rastgele yürüyüşle üretir.
+Kısıtsız bir yürüyüş bant genişliği yetersiz kenarlara sapar veya çıkmaz sokağa girer;
+sonuç ancak sonradan reddedilir ve aynı birey için onlarca deneme gerekir.
+
+Bu modüldeki ConstrainedWalker, bir (hedef, min_bw) çifti için bir kez hazırlanır:
+- Sadece bant genişliği min_bw'yi sağlayan kenarlar kullanılır.
+- Hedefe bu kenarlarla ulaşabilen düğümler (ters erişilebilirlik kümesi) ve hedefe
+  olan atlama (hop) mesafeleri önceden bulunur; yürüyüş bu kümenin dışına hiç çıkmaz.
+- Her adımda hedefe daha yakın veya eşit uzaklıktaki komşular tercih edilir; böylece
+  yollar rastgele ama gereksiz uzun olmaz.
+- Yürüyüş rastgele bir derinlik öncelikli aramadır: Yolda olmayan geçerli komşu kalmazsa
+  bir adım geri çekilir ve o düğüm bir daha denenmez. Her düğüm en fazla bir kez
+  bırakıldığı için bir çekiliş O(V + E) adımda biter.
+
+Sonuç: Kaynak hedefe ulaşabiliyorsa her çekiliş döngüsüz ve bant genişliğine uygun
+bir yol döndürür; popülasyon başlatma tam olarak popülasyon boyutu kadar yürüyüş sürer.
+"""
+
+from collections import deque
+
+
+class ConstrainedWalker:
+    """
+    Bir (hedef, min_bw) çifti için döngüsüz, bant genişliğine uygun rastgele yol üreticisi.
+
+    Kullanım:
+        walker = ConstrainedWalker(G, target, min_bw)
+        if walker.can_reach(source):
+            path = walker.walk([source], rng)
+    """
+    def __init__(self, G, target, min_bw):
+        self.target = target
+        self.min_bw = min_bw
+
+        def feasible(u, v):
+            return G[u][v].get("bandwidth", 0) >= min_bw
+
+        # Ters erişilebilirlik: Hedeften geriye doğru geçerli kenarlarla BFS (hop mesafesiyle)
+        predecessors = G.predecessors if G.is_directed() else G.neighbors
+        dist = {target: 0} if target in G else {}
+        queue = deque(dist)
+        while queue:
+            v = queue.popleft()
+            for u in predecessors(v):
+                if u not in dist and feasible(u, v):
+                    dist[u] = dist[v] + 1
+                    queue.append(u)
+        self.dist = dist
+        reachable = self.reachable = dist.keys()
+
+        # Sadece hedefe ulaşabilen komşulara giden geçerli kenarlar
+        self.adj = {u: [v for v in G.neighbors(u) if v in reachable and feasible(u, v)]
+                    for u in reachable}
+
+    def can_reach(self, node):
+        """node'dan hedefe bant genişliğine uygun bir yol var mı?"""
+        return node in self.reachable
+
+    def walk(self, prefix, rng):
+        """
+        Verilen yol başlangıcını (prefix) hedefe kadar rastgele uzatır.
+        Hedef komşuysa doğrudan ona gidilir; değilse hedefe daha yakın/eşit uzaklıktaki
+        komşulardan (yoksa herhangi bir komşudan) rastgele biri seçilir.
+        Prefix düğümleri tekrar ziyaret edilmez.
+
+        Returns:
+            list: Döngüsüz, geçerli yol veya prefix hedeften koparıyorsa None
+        """
+        path = list(prefix)
+        if not path or path[-1] not in self.reachable:
+            return None
+        base = len(path)
+        on_path = set(path)
+        dead = set()   # Tamamen denenmiş, hedefe yeni bir yol vermeyen düğümler
+        target = self.target
+        adj = self.adj
+        dist = self.dist
+
+        while path[-1] != target:
+            cur = path[-1]
+            nbrs = [v for v in adj[cur] if v not in on_path and v not in dead]
+            if not nbrs:
+                # Geri çekil (backtrack); prefix'in kendisi değiştirilmez
+                if len(path) == base:
+                    return None
+                node = path.pop()
+                on_path.discard(node)
+                dead.add(node)
+                continue
+            if target in nbrs:
+                nxt = target
+            else:
+                closer = [v for v in nbrs if dist[v] <= dist[cur]]
+                nxt = rng.choice(closer or nbrs)
+            path.append(nxt)
+            on_path.add(nxt)
+
+        return path
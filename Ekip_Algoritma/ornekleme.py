@@ -0,0 +1,71 @@
+"""
+Ağırlıklı Rastgele Seçim (Rulet Tekerleği) Modülü
+
+random.choices(population, weights=..., k=1) her çağrıda ağırlıklardan yeni bir kümülatif
+liste kurar; olasılıkları normalize eden liste de ayrıca oluşturulur. Aynı ağırlıklardan
+defalarca seçim yapan algoritmalarda (ör. bir ACO iterasyonu boyunca feromonu değişmeyen
+bir düğümden geçen tüm karıncalar) bu iş her adımda tekrarlanır.
+
+CumulativeSampler kümülatif toplamı tek geçişte bir kez kurar; her çekiliş tek bir
+rng.random() ve ikili arama (bisect) ile O(log n) sürede yapılır. Normalizasyon gerekmez:
+Rastgele sayı toplam ağırlıkla ölçeklenir.
+
+Çekiliş random.choices ile aynı kuralı kullanır (bisect_right, son indekse sınırlı);
+aynı rng durumu ve aynı ağırlıklar için aynı indeksi seçer.
+
+Kullanım (ACO, GA rulet seçimi, softmax / ε-greedy RL gibi ağırlıklı seçimler):
+    sampler = CumulativeSampler(weights)
+    i = sampler.sample(rng)            # Tüm ağırlıklar arasından
+    j = sampler.sample_unblocked(rng, items, visited)   # items[i] ziyaret edilmişse i dışlanır
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class CumulativeSampler:
+    """Ağırlık listesi için bir kez kurulan kümülatif toplam üzerinden ağırlıklı seçim."""
+    __slots__ = ("weights", "cumulative")
+
+    def __init__(self, weights):
+        self.weights = weights if isinstance(weights, list) else list(weights)
+        self.cumulative = list(accumulate(self.weights))
+
+    def sample(self, rng):
+        """
+        Ağırlıkla orantılı bir indeks çeker.
+
+        Returns:
+            int veya None (toplam ağırlık 0 ise, ör. tüm elemanlar dışlanmışsa)
+        """
+        cumulative = self.cumulative
+        if not cumulative:
+            return None
+        total = cumulative[-1]
+        if total <= 0:
+            return None
+        return bisect_right(cumulative, rng.random() * total, 0, len(cumulative) - 1)
+
+    def masked(self, blocked):
+        """blocked[i] doğru olan elemanların ağırlığı sıfırlanmış yeni bir örnekleyici döndürür."""
+        return CumulativeSampler([0.0 if b else w for w, b in zip(self.weights, blocked)])
+
+    def sample_unblocked(self, rng, items, blocked):
+        """
+        items[i] elemanı blocked içinde işaretli olmayan indeksler arasından ağırlıklı seçim.
+
+        Ret örneklemesi: Önce kurulu kümülatif toplamdan çekilir; seçilen eleman engelli değilse
+        kabul edilir (çoğu adımda maskeleme hiç yapılmaz). Engelliyse maskelenmiş satırdan
+        yeniden çekilir. İki aşamanın birleşik dağılımı, doğrudan maskelenmiş satırdan
+        çekilişle aynıdır: P(i) = w_i / (engelsiz ağırlıkların toplamı).
+
+        Returns:
+            int veya None (engelsiz elemanların toplam ağırlığı 0 ise)
+        """
+        k = self.sample(rng)
+        if k is None or not blocked[items[k]]:
+            return k
+        return self.masked(map(blocked.__getitem__, items)).sample(rng)
+
+    def __len__(self):
+        return len(self.cumulative)
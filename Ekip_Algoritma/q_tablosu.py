@@ -0,0 +1,186 @@
+"""
+Q-Tablosu Kayıt ve Sıcak Başlangıç (Warm Start) Modülü
+
+Bu modül, Q-Learning ve SARSA gibi pekiştirmeli öğrenme algoritmalarının
+öğrendiği Q-tablolarını diske kaydetmek ve topoloji değiştiğinde tekrar
+kullanmak için ortak yardımcıları içerir.
+
+Amaç:
+- Her çağrıda sıfır Q-tablosundan başlamak yerine önceki eğitimi kullanmak
+- Tek bir linkin kapasitesi/gecikmesi değiştiğinde tüm ağı yeniden eğitmemek
+- Sadece etkilenen bölgenin kısa bir ince ayar (fine-tuning) ile öğrenilmesi
+
+Kayıt Formatı:
+- Her tablo, sıkıştırılmış NumPy arşivi (.npz) olarak saklanır.
+- Diziler: state (int64), action (int64), q (float32), edge_sig (uint32)
+- Anahtar: (topoloji sürümü, hedef düğüm, ağırlıklar, opsiyonel etiket)
+- Dosya adı: q_{hedef}_{ağırlıklar}_{etiket}_{sürüm}.npz; etiket verilmezse sabit
+  "notag" yazılır, böylece etiketsiz (Q-Learning) ve etiketli (SARSA) tablolar
+  birbirinin arama desenine takılmaz.
+
+Sıcak Başlangıç (Remap):
+- Eski tablo, yeni topolojiye düğüm ve kenar ID'leri ile eşlenir.
+- Artık var olmayan kenarların ve özellikleri değişen kenarların değerleri atılır;
+  bu kenarlar sıfırdan öğrenilir, geri kalan tüm değerler korunur.
+- Kenar imzası, kenarın girdiği düğümün özelliklerini (güvenilirlik, işlem gecikmesi)
+  de içerir: Bir düğüm değiştiğinde o düğüme giren tüm aksiyonlar yeniden öğrenilir.
+"""
+
+import os
+import glob
+import zlib
+import hashlib
+import numpy as np
+
+
+def edge_signature(G, u, v):
+    """
+    (u, v) aksiyonunun 32-bit imzası: Kenarın özellikleri (bandwidth, delay, reliability...)
+    ve hedef düğüm v'nin özellikleri (reliability, processing_delay...). Aksiyonun maliyeti
+    ikisine de bağlı olduğundan biri değişince imza da değişir.
+    """
+    attrs = (sorted(G[u][v].items()), sorted(G.nodes[v].items()))
+    return zlib.crc32(repr(attrs).encode("utf-8"))
+
+
+def topology_version(G):
+    """
+    Grafın düğüm, kenar ve özelliklerinden kısa bir sürüm kimliği (hash) üretir.
+    Topolojide herhangi bir değişiklik (link ekleme/silme, kapasite/gecikme değişimi)
+    farklı bir sürüm verir.
+    """
+    h = hashlib.sha1()
+    for n in sorted(G.nodes()):
+        h.update(repr((n, sorted(G.nodes[n].items()))).encode("utf-8"))
+    for u, v in sorted(tuple(sorted(e)) for e in G.edges()):
+        h.update(repr((u, v, sorted(G[u][v].items()))).encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def remap_q_table(G, old_q, old_sigs=None):
+    """
+    Eski bir Q-tablosunu değiştirilmiş topolojiye eşler.
+
+    Args:
+        G: Yeni (değiştirilmiş) NetworkX grafı
+        old_q: dict - {(state, action): q_value}
+        old_sigs: dict - {(state, action): edge_signature} (None ise imza kontrolü yapılmaz)
+
+    Returns:
+        tuple: (dict: yeni Q değerleri, int: korunan kayıt sayısı, int: atılan kayıt sayısı)
+    """
+    new_q = {}
+    dropped = 0
+    for (s, a), value in old_q.items():
+        # Düğüm veya kenar artık yoksa kaydı at
+        if not G.has_edge(s, a):
+            dropped += 1
+            continue
+        # Kenarın özellikleri değiştiyse (etkilenen bölge) kaydı at, yeniden öğrenilsin
+        if old_sigs is not None and old_sigs.get((s, a)) != edge_signature(G, s, a):
+            dropped += 1
+            continue
+        new_q[(s, a)] = value
+    return new_q, len(new_q), dropped
+
+
+class QTableStore:
+    """
+    Q-tablolarını bir dizinde saklayan basit depo.
+
+    Kullanım:
+        store = QTableStore("q_tablolari")
+        path, cost = train_q_learning(..., q_store=store)   # Kaydeder
+        # Topoloji değişti (ör. bir linkin kapasitesi düştü):
+        path, cost = train_q_learning(..., episodes=50, q_store=store)  # Sıcak başlangıç
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    NO_TAG = "notag"   # Etiketsiz tablolar için sabit etiket alanı
+
+    @classmethod
+    def _weights_key(cls, weights, tag=None):
+        key = "-".join(f"{w:.4f}" for w in weights)
+        return f"{key}_{cls.NO_TAG if tag is None else tag}"
+
+    def filename(self, version, destination, weights, tag=None):
+        """Anahtar (sürüm, hedef, ağırlıklar, etiket) için dosya yolunu döndürür."""
+        name = f"q_{destination}_{self._weights_key(weights, tag)}_{version}.npz"
+        return os.path.join(self.directory, name)
+
+    def save(self, G, Q, destination, weights, tag=None):
+        """
+        Q-tablosunu kompakt ikili dizi olarak kaydeder.
+
+        Args:
+            G: Tablonun öğrenildiği graf (sürüm ve kenar imzaları için)
+            Q: dict - {(state, action): q_value} veya {state: {action: q_value}}
+            destination: Hedef düğüm
+            weights: tuple - (w_delay, w_rel, w_res)
+            tag: str - Ek ayırt edici (ör. SARSA için min bant genişliği)
+
+        Returns:
+            str: Kaydedilen dosyanın yolu
+        """
+        items = list(self._iter_items(Q))
+        state = np.array([s for (s, _), _ in items], dtype=np.int64)
+        action = np.array([a for (_, a), _ in items], dtype=np.int64)
+        q = np.array([v for _, v in items], dtype=np.float32)
+        sig = np.array([edge_signature(G, s, a) for (s, a), _ in items], dtype=np.uint32)
+
+        version = topology_version(G)
+        fpath = self.filename(version, destination, weights, tag)
+        # np.savez_compressed uzantı eklemesin diye dosya nesnesi kullanılır
+        with open(fpath, "wb") as f:
+            np.savez_compressed(f, state=state, action=action, q=q, edge_sig=sig)
+        return fpath
+
+    def load(self, fpath):
+        """Kaydedilmiş bir tabloyu okur: ({(s, a): q}, {(s, a): edge_sig})."""
+        with np.load(fpath) as data:
+            keys = list(zip(data["state"].tolist(), data["action"].tolist()))
+            q = dict(zip(keys, data["q"].astype(float).tolist()))
+            sigs = dict(zip(keys, data["edge_sig"].tolist()))
+        return q, sigs
+
+    def warm_start(self, G, destination, weights, tag=None):
+        """
+        Verilen graf için başlangıç Q değerlerini döndürür.
+
+        1. Aynı topoloji sürümü için kayıt varsa doğrudan o kullanılır.
+        2. Yoksa aynı (hedef, ağırlıklar) için en son kaydedilen tablo yeni topolojiye eşlenir.
+        3. Hiç kayıt yoksa boş sözlük döner (sıfırdan eğitim).
+
+        Returns:
+            dict: {(state, action): q_value}
+        """
+        exact = self.filename(topology_version(G), destination, weights, tag)
+        if os.path.exists(exact):
+            q, _ = self.load(exact)
+            print(f"♻️  Q-tablosu yüklendi (aynı topoloji): {len(q)} kayıt")
+            return q
+
+        # Etiket alanı her zaman dolu ve sürüm alanı alt çizgi içermediğinden desen
+        # sadece aynı (hedef, ağırlıklar, etiket) tablolarıyla eşleşir
+        pattern = self.filename("*", destination, weights, tag)
+        candidates = glob.glob(pattern)
+        if not candidates:
+            return {}
+
+        latest = max(candidates, key=os.path.getmtime)
+        old_q, old_sigs = self.load(latest)
+        q, kept, dropped = remap_q_table(G, old_q, old_sigs)
+        print(f"♻️  Q-tablosu yeni topolojiye eşlendi: {kept} kayıt korundu, {dropped} kayıt atıldı")
+        return q
+
+    @staticmethod
+    def _iter_items(Q):
+        """İki Q formatını da ((s, a), q) çiftlerine çevirir."""
+        for key, value in Q.items():
+            if isinstance(value, dict):
+                for a, v in value.items():
+                    yield (key, a), v
+            else:
+                yield key, value
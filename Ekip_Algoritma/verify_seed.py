@@ -31,28 +31,59 @@ def create_dummy_graph():
         G[u][v]['weight'] = 1.0 # Dummy weight
     return G
 
-G = create_dummy_graph()
-S, D = 0, 19
-min_bw = 5
-
-print("\n--- Running Sarsa Run 1 (Seed=42) ---")
-path1, cost1 = sarsa_route(G, S, D, min_bw, episodes=100, seed=42)
-print(f"Path1: {path1}")
-
-print("\n--- Running Sarsa Run 2 (Seed=42) ---")
-path2, cost2 = sarsa_route(G, S, D, min_bw, episodes=100, seed=42)
-print(f"Path2: {path2}")
-
-if path1 == path2:
-    print("\n✅ Verification SUCCESS: Paths are identical.")
-else:
-    print("\n❌ Verification FAILED: Paths different.")
-
-print("\n--- Running Sarsa Run 3 (Seed=99) ---")
-path3, cost3 = sarsa_route(G, S, D, min_bw, episodes=100, seed=99)
-print(f"Path3: {path3}")
-
-if path1 != path3:
-    print("✅ Seed variation confirmed: different seed produced different path (likely).")
-else:
-    print("⚠️ Warning: Different seed produced same path (could happen if graph is simple).")
+# Parallel-mode worker processes (spawn) re-import this file,
+# so the checks only run when the script is executed directly.
+def main():
+    G = create_dummy_graph()
+    S, D = 0, 19
+    min_bw = 5
+
+    print("\n--- Running Sarsa Run 1 (Seed=42) ---")
+    path1, cost1 = sarsa_route(G, S, D, min_bw, episodes=100, seed=42)
+    print(f"Path1: {path1}")
+
+    print("\n--- Running Sarsa Run 2 (Seed=42) ---")
+    path2, cost2 = sarsa_route(G, S, D, min_bw, episodes=100, seed=42)
+    print(f"Path2: {path2}")
+
+    if path1 == path2:
+        print("\n✅ Verification SUCCESS: Paths are identical.")
+    else:
+        print("\n❌ Verification FAILED: Paths different.")
+
+    print("\n--- Running Sarsa Run 3 (Seed=99) ---")
+    path3, cost3 = sarsa_route(G, S, D, min_bw, episodes=100, seed=99)
+    print(f"Path3: {path3}")
+
+    if path1 != path3:
+        print("✅ Seed variation confirmed: different seed produced different path (likely).")
+    else:
+        print("⚠️ Warning: Different seed produced same path (could happen if graph is simple).")
+
+    print("\n--- Running Sarsa Runs 4-5 Concurrently in Threads (Seed=42, Seed=99) ---")
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        f42 = pool.submit(sarsa_route, G, S, D, min_bw, episodes=100, seed=42)
+        f99 = pool.submit(sarsa_route, G, S, D, min_bw, episodes=100, seed=99)
+        path4, _ = f42.result()
+        path5, _ = f99.result()
+
+    if path4 == path1 and path5 == path3:
+        print("✅ Verification SUCCESS: Concurrent runs reproduce the sequential paths.")
+    else:
+        print("❌ Verification FAILED: Concurrent runs differ from sequential runs.")
+
+    print("\n--- Running Parallel Sarsa Runs 6-7 (Seed=42, workers=2) ---")
+    path6, _ = sarsa_route(G, S, D, min_bw, episodes=100, seed=42, workers=2)
+    path7, _ = sarsa_route(G, S, D, min_bw, episodes=100, seed=42, workers=2)
+    print(f"Path6: {path6}")
+    print(f"Path7: {path7}")
+
+    if path6 == path7:
+        print("✅ Verification SUCCESS: Parallel runs with the same (seed, workers) are identical.")
+    else:
+        print("❌ Verification FAILED: Parallel runs with the same (seed, workers) differ.")
+
+
+if __name__ == "__main__":
+    main()